@@ -7,6 +7,7 @@ from dashboard.pages import (
     retention,
     funnel_analysis,
 )
+from dashboard.utils.filters import render_filters
 
 # Page Config
 st.set_page_config(
@@ -63,31 +64,35 @@ def auto_refresh(interval=5):
         st.rerun()
 
 
+# Global filters, shared by every page and part of each page's cache keys
+filters = render_filters()
+
+
 # Page rendering
 if page == "User Analysis":
     st.sidebar.success("Analyzing Users 📈")
     auto_refresh(interval=10)
-    user_analysis.show()
+    user_analysis.show(filters)
 
 elif page == "KYC Status Analysis":
     st.sidebar.success("KYC Verification Insights 🔍")
     auto_refresh(interval=15)
-    kyc_status.show()
+    kyc_status.show(filters)
 
 elif page == "Transaction Analysis":
     st.sidebar.success("Exploring Transactions 💰")
     auto_refresh(interval=10)
-    transaction_analysis.show()
+    transaction_analysis.show(filters)
 
 elif page == "Retention Analysis":
     st.sidebar.success("User Retention Metrics 🔄")
     auto_refresh(interval=12)
-    retention.show()
+    retention.show(filters)
 
 elif page == "Funnel Analysis":
     st.sidebar.success("Funnel Conversion Insights 📊")
     auto_refresh(interval=10)
-    funnel_analysis.show()
+    funnel_analysis.show(filters)
 
 
 # --- CONTACT & GITHUB LINKS ---
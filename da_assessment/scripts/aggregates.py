@@ -0,0 +1,88 @@
+import pandas as pd
+
+
+KYC_STATUS_LABELS = {
+    1: "Not Started",
+    2: "Pending",
+    3: "Passed",
+    4: "In Review",
+    5: "Unspecified",
+    6: "Failed",
+}
+
+ACTIVE_USER_FREQUENCIES = {
+    "D": "Date",
+    "W": "Week",
+    "M": "Month",
+}
+
+
+def funnel_counts(users: pd.DataFrame, transactions: pd.DataFrame) -> pd.DataFrame:
+    """
+    Counts users at each stage of the onboarding funnel. Only the UserId column
+    of `transactions` is read, so the per-user feature table works as well.
+    """
+
+    verified_ids = users.loc[users["IsKYCVerified"] == True, "Id"]
+    transacting_ids = transactions.loc[
+        transactions["UserId"].isin(verified_ids), "UserId"
+    ]
+
+    return pd.DataFrame(
+        {
+            "Stage": [
+                "Acquisition",
+                "Complete Profile",
+                "KYC Verified",
+                "Transaction",
+            ],
+            "Users": [
+                users.shape[0],
+                int((users["CompletedProfile"] == True).sum()),
+                int((users["IsKYCVerified"] == True).sum()),
+                transacting_ids.nunique(),
+            ],
+        }
+    )
+
+
+def kyc_distribution(users: pd.DataFrame) -> pd.DataFrame:
+    """Counts users per KYC status, sorted from highest to lowest"""
+
+    kyc_counts = (
+        users["KycStatus"].map(KYC_STATUS_LABELS).value_counts().reset_index()
+    )
+    kyc_counts.columns = ["KYC Status", "User Count"]
+    return kyc_counts.sort_values(by="User Count", ascending=False)
+
+
+def active_users(transactions: pd.DataFrame, freq: str = "D") -> pd.DataFrame:
+    """Counts distinct transacting users per day, week or month"""
+
+    if freq not in ACTIVE_USER_FREQUENCIES:
+        raise ValueError(
+            f"Unsupported frequency '{freq}', "
+            f"expected one of {list(ACTIVE_USER_FREQUENCIES)}"
+        )
+
+    dates = pd.to_datetime(transactions["DateCreated"])
+    if freq == "D":
+        period = dates.dt.normalize()
+    else:
+        period = dates.dt.to_period(freq).dt.to_timestamp()
+
+    counts = transactions.groupby(period)["UserId"].nunique().reset_index()
+    counts.columns = [ACTIVE_USER_FREQUENCIES[freq], "Active Users"]
+    return counts
+
+
+def corridor_volumes(transactions: pd.DataFrame) -> pd.DataFrame:
+    """Sums the send volume per currency corridor, sorted from highest to lowest"""
+
+    volumes = (
+        transactions.groupby(["SendCurrencyId", "ReceiveCurrencyId"])["SendAmount"]
+        .sum()
+        .reset_index()
+    )
+    volumes.columns = ["Send Currency", "Receive Currency", "Total Volume"]
+    return volumes.sort_values(by="Total Volume", ascending=False)
@@ -0,0 +1,162 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+import tornado.web
+from da_assessment.scripts.aggregates import (
+    ACTIVE_USER_FREQUENCIES,
+    active_users,
+    corridor_volumes,
+    funnel_counts,
+    kyc_distribution,
+)
+from da_assessment.scripts.config import (
+    API_HOST,
+    API_PORT,
+    API_WORKERS,
+    PROCESSED_USER_DATA,
+    PROCESSED_TRANSACTION_DATA,
+)
+
+
+CONTENT_TYPES = {
+    "json": "application/json",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+
+class Dataset:
+    """Holds the processed tables in memory so every request shares one copy"""
+
+    def __init__(self, users: pd.DataFrame, transactions: pd.DataFrame):
+        self.users = users
+        self.transactions = transactions
+
+    @classmethod
+    def load(cls) -> "Dataset":
+        users = pd.read_csv(PROCESSED_USER_DATA)
+        transactions = pd.read_csv(
+            PROCESSED_TRANSACTION_DATA, parse_dates=["DateCreated"]
+        )
+        return cls(users, transactions)
+
+
+class Coalescer:
+    """
+    Runs aggregations in an executor and shares one in-flight result between
+    identical concurrent requests.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self.executor = executor
+        self._inflight = {}
+
+    async def run(self, key, func, *args):
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, func, *args)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so a cancelled client does not cancel the result for the others
+        return await asyncio.shield(future)
+
+
+def serialize(frame: pd.DataFrame, fmt: str) -> bytes:
+    """Serializes an aggregate as JSON records or an Arrow IPC stream"""
+
+    if fmt == "arrow":
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    return frame.to_json(orient="records", date_format="iso").encode("utf-8")
+
+
+def compute(dataset: Dataset, metric: str, freq: str, fmt: str) -> bytes:
+    """Computes and serializes one aggregate; runs inside the executor"""
+
+    if metric == "funnel":
+        frame = funnel_counts(dataset.users, dataset.transactions)
+    elif metric == "kyc":
+        frame = kyc_distribution(dataset.users)
+    elif metric == "active-users":
+        frame = active_users(dataset.transactions, freq)
+    else:
+        frame = corridor_volumes(dataset.transactions)
+
+    return serialize(frame, fmt)
+
+
+class MetricHandler(tornado.web.RequestHandler):
+    def initialize(self, dataset: Dataset, coalescer: Coalescer):
+        self.dataset = dataset
+        self.coalescer = coalescer
+
+    async def get(self, metric: str):
+        fmt = self.get_query_argument("format", "json")
+        if fmt not in CONTENT_TYPES:
+            raise tornado.web.HTTPError(400, reason=f"Unsupported format '{fmt}'")
+
+        freq = self.get_query_argument("freq", "D").upper()
+        if metric == "active-users" and freq not in ACTIVE_USER_FREQUENCIES:
+            raise tornado.web.HTTPError(400, reason=f"Unsupported freq '{freq}'")
+        if metric != "active-users":
+            freq = None
+
+        body = await self.coalescer.run(
+            (metric, freq, fmt), compute, self.dataset, metric, freq, fmt
+        )
+        self.set_header("Content-Type", CONTENT_TYPES[fmt])
+        self.write(body)
+
+
+class HealthHandler(tornado.web.RequestHandler):
+    def initialize(self, dataset: Dataset):
+        self.dataset = dataset
+
+    def get(self):
+        self.write(
+            json.dumps(
+                {
+                    "status": "ok",
+                    "users": int(self.dataset.users.shape[0]),
+                    "transactions": int(self.dataset.transactions.shape[0]),
+                }
+            )
+        )
+
+
+def make_app(dataset: Dataset, executor: ThreadPoolExecutor) -> tornado.web.Application:
+    """Builds the Tornado application serving the dashboard aggregates"""
+
+    coalescer = Coalescer(executor)
+    return tornado.web.Application(
+        [
+            (r"/health", HealthHandler, {"dataset": dataset}),
+            (
+                r"/metrics/(funnel|kyc|active-users|corridors)",
+                MetricHandler,
+                {"dataset": dataset, "coalescer": coalescer},
+            ),
+        ]
+    )
+
+
+async def main():
+    dataset = Dataset.load()
+    # Threads rather than processes: the aggregations read the shared
+    # in-memory frames, and pandas releases the GIL for most of the heavy work
+    with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+        app = make_app(dataset, executor)
+        app.listen(API_PORT, address=API_HOST)
+        print(f"Aggregate API listening on http://{API_HOST}:{API_PORT}")
+        await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
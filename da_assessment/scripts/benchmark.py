@@ -0,0 +1,141 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+from dashboard.utils import figures
+from da_assessment.scripts.narration_index import NarrationIndex
+from da_assessment.scripts.config import (
+    PROCESSED_TRANSACTION_DATA,
+    NARRATION_INDEX,
+)
+
+
+PAGES = [
+    "User Analysis",
+    "KYC Status Analysis",
+    "Transaction Analysis",
+    "Retention Analysis",
+    "Funnel Analysis",
+]
+
+
+def run_page(app: AppTest, page: str) -> float:
+    """Renders one dashboard page and returns the wall time in milliseconds"""
+
+    start = time.perf_counter()
+    app.sidebar.selectbox[0].select(page).run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if app.exception:
+        raise RuntimeError(f"{page} failed: {app.exception[0].message}")
+    return elapsed
+
+
+def benchmark_figures(app_path: str):
+    """
+    Renders every page with a cold figure cache, then again with a warm one,
+    and reports build/serialize time and payload size per chart.
+    """
+
+    figures.clear_figure_cache()
+    figures.RECORD_FIGURE_STATS = True
+
+    app = AppTest.from_file(app_path, default_timeout=600)
+    app.run()
+
+    print(f"{'Page':<24}{'Cold (ms)':>12}{'Warm (ms)':>12}")
+    for page in PAGES:
+        cold = run_page(app, page)
+        # Every Streamlit rerun executes the whole script, now with warm caches
+        warm = run_page(app, page)
+        print(f"{page:<24}{cold:>12.1f}{warm:>12.1f}")
+
+    print()
+    print(f"{'Chart':<52}{'Build (ms)':>12}{'Serialize (ms)':>16}{'Payload (KB)':>14}")
+    for chart, stats in figures.FIGURE_STATS.items():
+        print(
+            f"{chart[:50]:<52}{stats['build_ms']:>12.1f}"
+            f"{stats['serialize_ms']:>16.1f}{stats['payload_bytes'] / 1024:>14.1f}"
+        )
+
+
+def time_query(func, query: str, repeats: int) -> list:
+    """Runs a query `repeats` times and returns the latencies in milliseconds"""
+
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def scan_pattern(query: str) -> str:
+    """Builds the regex a `str.contains` scan needs to answer a narration query"""
+
+    lookaheads = [
+        rf"(?=.*\b{word[:-1]})" if word.endswith("*") else rf"(?=.*\b{word}\b)"
+        for word in query.split()
+    ]
+    return "".join(lookaheads)
+
+
+def benchmark_narration(repeats: int):
+    """
+    Times term and prefix queries against the narration index, next to the
+    equivalent `str.contains` scan over the processed transactions.
+    """
+
+    start = time.perf_counter()
+    index = NarrationIndex.load(NARRATION_INDEX)
+    load_ms = (time.perf_counter() - start) * 1000
+    narrations = pd.read_csv(PROCESSED_TRANSACTION_DATA, usecols=["Narration"])[
+        "Narration"
+    ]
+
+    vocabulary = index.segments[0].vocabulary if index.segments else []
+    queries = [str(token) for token in vocabulary[:: max(1, len(vocabulary) // 5)]]
+    queries += [query[:3] + "*" for query in queries if len(query) >= 3]
+    queries.append(" ".join(queries[:2]))
+
+    print(f"Index: {len(vocabulary)} tokens over {index.row_count} rows")
+    print(f"Load: {load_ms:.1f} ms")
+    print()
+    print(
+        f"{'Query':<28}{'Rows':>10}{'Index p50':>12}{'Index p99':>12}"
+        f"{'Scan p50':>12}"
+    )
+    for query in queries:
+        rows = index.search(query)
+        indexed = time_query(index.search, query, repeats)
+        scanned = time_query(
+            lambda pattern: narrations.str.contains(pattern, case=False),
+            scan_pattern(query),
+            max(1, repeats // 20),
+        )
+        print(
+            f"{query[:26]:<28}{len(rows):>10}"
+            f"{np.percentile(indexed, 50):>12.3f}{np.percentile(indexed, 99):>12.3f}"
+            f"{np.percentile(scanned, 50):>12.1f}"
+        )
+    print("(latencies in ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard benchmark suite")
+    parser.add_argument("suite", choices=["figures", "narration"])
+    parser.add_argument("--app", default="app.py", help="Path to the Streamlit app")
+    parser.add_argument(
+        "--repeats", type=int, default=200, help="Runs per narration query"
+    )
+    args = parser.parse_args()
+
+    if args.suite == "figures":
+        benchmark_figures(args.app)
+    elif args.suite == "narration":
+        benchmark_narration(args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,3 +8,17 @@ UNPROCESSED_USER_DATA = os.getenv("UNPROCESSED_USER_DATA")
 UNPROCESSED_TRANSACTION_DATA = os.getenv("UNPROCESSED_TRANSACTION_DATA")
 PROCESSED_USER_DATA = os.getenv("PROCESSED_USER_DATA")
 PROCESSED_TRANSACTION_DATA = os.getenv("PROCESSED_TRANSACTION_DATA")
+PROCESSED_DEMOGRAPHICS_CUBE = os.getenv("PROCESSED_DEMOGRAPHICS_CUBE")
+IDENTITY_INDEX = os.getenv("IDENTITY_INDEX")
+NARRATION_INDEX = os.getenv("NARRATION_INDEX")
+PROCESSED_USER_FEATURES = os.getenv("PROCESSED_USER_FEATURES")
+QUARANTINED_USER_DATA = os.getenv("QUARANTINED_USER_DATA")
+QUARANTINED_TRANSACTION_DATA = os.getenv("QUARANTINED_TRANSACTION_DATA")
+
+# Number of transaction rows validated and written per pass
+PROCESSING_CHUNKSIZE = int(os.getenv("PROCESSING_CHUNKSIZE", "1000000"))
+
+# Aggregate API server settings
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "8502"))
+API_WORKERS = int(os.getenv("API_WORKERS", "4"))
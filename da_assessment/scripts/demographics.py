@@ -0,0 +1,50 @@
+import pandas as pd
+
+
+AGE_BINS = [0, 17, 25, 35, 45, 55, 65, 100]
+AGE_LABELS = ["<18", "18-25", "26-35", "36-45", "46-55", "56-65", "65+"]
+
+CUBE_DIMENSIONS = ["AgeGroup", "Gender", "ResidenceCountry", "KycStatus"]
+
+
+def compute_age(date_of_birth: pd.Series, as_of) -> pd.Series:
+    """
+    Computes ages in whole years as of the given date, subtracting a year for
+    users whose birthday has not yet come round that year.
+    """
+
+    dob = pd.to_datetime(date_of_birth, errors="coerce", format="ISO8601")
+    as_of = pd.Timestamp(as_of)
+
+    before_birthday = (dob.dt.month > as_of.month) | (
+        (dob.dt.month == as_of.month) & (dob.dt.day > as_of.day)
+    )
+    age = as_of.year - dob.dt.year - before_birthday.astype("int16")
+    return age.astype("Int16")
+
+
+def age_group(age: pd.Series) -> pd.Series:
+    """Bins ages into the dashboard's age groups"""
+
+    return pd.cut(
+        age, bins=AGE_BINS, labels=AGE_LABELS, right=True, include_lowest=True
+    )
+
+
+def build_demographics_cube(users: pd.DataFrame) -> pd.DataFrame:
+    """Counts users for every age group × gender × country × KYC status combination"""
+
+    return (
+        users.groupby(CUBE_DIMENSIONS, observed=True, dropna=False)
+        .size()
+        .reset_index(name="Users")
+    )
+
+
+def order_age_groups(frame: pd.DataFrame) -> pd.DataFrame:
+    """Restores the age group ordering lost when a cube is read back from CSV"""
+
+    frame["AgeGroup"] = pd.Categorical(
+        frame["AgeGroup"], categories=AGE_LABELS, ordered=True
+    )
+    return frame
@@ -0,0 +1,110 @@
+import pandas as pd
+
+
+SEGMENT_BINS = [0, 3, 5, 10, 20, float("inf")]
+SEGMENT_LABELS = ["1-3", "4-5", "6-10", "11-20", "20+"]
+
+FEATURE_COLUMNS = [
+    "UserId",
+    "TransactionCount",
+    "TotalBaseAmount",
+    "AvgBaseAmount",
+    "FirstTransactionDate",
+    "LastTransactionDate",
+    "ActiveDays",
+    "Segment",
+]
+
+
+def segment_users(transaction_counts: pd.Series) -> pd.Series:
+    """Bins users into transaction volume segments"""
+
+    return pd.cut(transaction_counts, bins=SEGMENT_BINS, labels=SEGMENT_LABELS)
+
+
+def transaction_days(transactions: pd.DataFrame) -> pd.Series:
+    """Returns the calendar day of each transaction"""
+
+    return pd.to_datetime(transactions["DateCreated"], format="ISO8601").dt.normalize()
+
+
+def build_user_features(transactions: pd.DataFrame) -> pd.DataFrame:
+    """Computes one row of transaction features per user"""
+
+    features = (
+        transactions.assign(Day=transaction_days(transactions))
+        .groupby("UserId")
+        .agg(
+            TransactionCount=("Day", "size"),
+            TotalBaseAmount=("BaseAmount", "sum"),
+            FirstTransactionDate=("Day", "min"),
+            LastTransactionDate=("Day", "max"),
+            ActiveDays=("Day", "nunique"),
+        )
+        .reset_index()
+    )
+    return finish_features(features)
+
+
+def update_user_features(
+    features: pd.DataFrame, user_days: pd.DataFrame, new_transactions: pd.DataFrame
+) -> tuple:
+    """
+    Folds new transactions into an existing feature table without rescanning
+    the transactions already counted, and returns the updated table and
+    user days.
+
+    `user_days` holds the distinct (UserId, Day) pairs seen so far (bounded by
+    users × days rather than by transactions), so ActiveDays is exact whatever
+    order the transactions arrive in. Pass None for both to start a new table.
+    """
+
+    new_days = pd.DataFrame(
+        {
+            "UserId": new_transactions["UserId"],
+            "Day": transaction_days(new_transactions),
+        }
+    ).drop_duplicates(ignore_index=True)
+    user_days = pd.concat([user_days, new_days]).drop_duplicates(ignore_index=True)
+    active_days = user_days.groupby("UserId").size()
+
+    delta = build_user_features(new_transactions)
+    if features is None or features.empty:
+        return delta, user_days
+
+    merged = features.merge(delta, on="UserId", how="outer", suffixes=("", "_new"))
+    for column in ["TransactionCount", "TotalBaseAmount"]:
+        merged[column] = merged[column].fillna(0) + merged[column + "_new"].fillna(0)
+    merged["ActiveDays"] = merged["UserId"].map(active_days)
+
+    merged["FirstTransactionDate"] = merged[
+        ["FirstTransactionDate", "FirstTransactionDate_new"]
+    ].min(axis=1)
+    merged["LastTransactionDate"] = merged[
+        ["LastTransactionDate", "LastTransactionDate_new"]
+    ].max(axis=1)
+    merged = merged.astype({"TransactionCount": "int64", "ActiveDays": "int64"})
+
+    return finish_features(merged), user_days
+
+
+def finish_features(features: pd.DataFrame) -> pd.DataFrame:
+    """Derives the average amount and segment, and orders the columns"""
+
+    features["AvgBaseAmount"] = (
+        features["TotalBaseAmount"] / features["TransactionCount"]
+    )
+    features["Segment"] = segment_users(features["TransactionCount"])
+    return features[FEATURE_COLUMNS]
+
+
+def read_user_features(path: str) -> pd.DataFrame:
+    """Reads a saved feature table, restoring the date and segment types"""
+
+    features = pd.read_csv(
+        path, parse_dates=["FirstTransactionDate", "LastTransactionDate"]
+    )
+    features["Segment"] = pd.Categorical(
+        features["Segment"], categories=SEGMENT_LABELS, ordered=True
+    )
+    return features
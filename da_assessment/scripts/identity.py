@@ -0,0 +1,176 @@
+import os
+import numpy as np
+import pandas as pd
+
+
+def normalize_emails(emails: pd.Series) -> pd.Series:
+    """
+    Normalizes emails so aliases of one mailbox compare equal: lowercases,
+    drops '+tags' and removes dots from the local part.
+    """
+
+    emails = emails.astype("string").str.strip().str.lower()
+    if emails.empty:
+        return emails
+    parts = emails.str.rpartition("@")
+    local = parts[0].str.split("+", n=1).str[0].str.replace(".", "", regex=False)
+
+    # Values without an '@' are kept as they are
+    return (local + "@" + parts[2]).where(parts[1] == "@", emails)
+
+
+def identity_keys(emails: pd.Series) -> pd.Series:
+    """Hashes normalized emails into stable 64-bit integer keys"""
+
+    normalized = normalize_emails(emails).fillna("")
+    keys = pd.util.hash_array(normalized.to_numpy(dtype=object)).view("int64")
+    return pd.Series(keys, index=emails.index)
+
+
+class IdentityIndex:
+    """
+    Maps identity keys (hashed normalized emails) to the user ids sharing them.
+    Keys shared by more than one user are tracked as they are added, so the
+    multi-account count and cluster listing never scan the user table. Users
+    missing from the latest update are pruned, and users whose email changed
+    are re-keyed; either makes the next save rewrite the file instead of
+    appending to it.
+    """
+
+    COLUMNS = ["IdentityKey", "NormalizedEmail", "UserId"]
+
+    def __init__(self):
+        self.accounts = {}
+        self.emails = {}
+        self.user_keys = {}
+        self.duplicate_keys = set()
+        self._unsaved = []
+        self._rewrite = False
+
+    @classmethod
+    def load(cls, path: str, missing_ok: bool = False) -> "IdentityIndex":
+        """
+        Loads a saved index. A missing file raises FileNotFoundError unless
+        `missing_ok`, when an empty index is returned to be built from scratch.
+        """
+
+        index = cls()
+        if not os.path.exists(path):
+            if missing_ok:
+                return index
+            raise FileNotFoundError(f"Identity index not found: {path}")
+        saved = pd.read_csv(path, dtype={"UserId": str, "NormalizedEmail": str})
+        index._add(saved, unsaved=False)
+        return index
+
+    def update(self, users: pd.DataFrame) -> int:
+        """
+        Syncs the index with `users`: prunes indexed users no longer present
+        or whose UserName now maps to another identity (or to none), then adds
+        users not yet in the index. Returns how many users were (re-)added.
+        """
+
+        users = users.drop_duplicates(subset="Id")
+        indexed = users[users["Id"].isin(list(self.user_keys))]
+        stored_keys = np.fromiter(
+            (self.user_keys[user_id] for user_id in indexed["Id"]),
+            dtype="int64",
+            count=len(indexed),
+        )
+        changed = indexed["UserName"].isna().to_numpy() | (
+            identity_keys(indexed["UserName"]).to_numpy() != stored_keys
+        )
+        self._prune(
+            set(self.user_keys).difference(users["Id"])
+            | set(indexed["Id"].to_numpy()[changed])
+        )
+
+        # Users without a UserName cannot be matched to anyone, so are skipped
+        new_users = users[
+            users["UserName"].notna() & ~users["Id"].isin(list(self.user_keys))
+        ]
+        rows = pd.DataFrame(
+            {
+                "IdentityKey": identity_keys(new_users["UserName"]),
+                "NormalizedEmail": normalize_emails(new_users["UserName"]),
+                "UserId": new_users["Id"],
+            }
+        )
+        self._add(rows, unsaved=True)
+        return len(rows)
+
+    def save(self, path: str):
+        """
+        Appends the users added since the last save to the index file, or
+        rewrites the file if users were pruned.
+        """
+
+        if self._rewrite:
+            keys = list(self.user_keys.values())
+            rows = pd.DataFrame(
+                {
+                    "IdentityKey": keys,
+                    "NormalizedEmail": [self.emails[key] for key in keys],
+                    "UserId": list(self.user_keys),
+                },
+                columns=self.COLUMNS,
+            )
+            rows.to_csv(path, index=False)
+        elif self._unsaved:
+            rows = pd.concat(self._unsaved)
+            rows.to_csv(path, mode="a", header=not os.path.exists(path), index=False)
+        self._unsaved = []
+        self._rewrite = False
+
+    @property
+    def multi_account_count(self) -> int:
+        """Number of identities behind more than one account"""
+
+        return len(self.duplicate_keys)
+
+    def duplicates_of(self, user_id) -> list:
+        """Returns the other user ids sharing the user's identity"""
+
+        key = self.user_keys.get(user_id)
+        if key is None:
+            return []
+        return [other for other in self.accounts[key] if other != user_id]
+
+    def clusters(self) -> pd.DataFrame:
+        """Lists every identity with more than one account, largest first"""
+
+        clusters = pd.DataFrame(
+            {
+                "IdentityKey": list(self.duplicate_keys),
+                "NormalizedEmail": [self.emails[key] for key in self.duplicate_keys],
+                "UserIds": [self.accounts[key] for key in self.duplicate_keys],
+            },
+            columns=["IdentityKey", "NormalizedEmail", "UserIds"],
+        )
+        clusters["Accounts"] = clusters["UserIds"].str.len()
+        return clusters.sort_values("Accounts", ascending=False, ignore_index=True)
+
+    def _prune(self, user_ids: set):
+        for user_id in user_ids:
+            key = self.user_keys.pop(user_id)
+            accounts = self.accounts[key]
+            accounts.remove(user_id)
+            if len(accounts) < 2:
+                self.duplicate_keys.discard(key)
+            if not accounts:
+                del self.accounts[key], self.emails[key]
+        if user_ids:
+            self._rewrite = True
+
+    def _add(self, rows: pd.DataFrame, unsaved: bool):
+        for key, email, user_id in rows[self.COLUMNS].itertuples(index=False):
+            if user_id in self.user_keys:
+                continue
+            accounts = self.accounts.setdefault(key, [])
+            accounts.append(user_id)
+            self.emails.setdefault(key, email)
+            self.user_keys[user_id] = key
+            if len(accounts) > 1:
+                self.duplicate_keys.add(key)
+        if unsaved and len(rows):
+            self._unsaved.append(rows[self.COLUMNS])
@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from da_assessment.scripts.config import API_HOST, API_PORT
+
+
+DEFAULT_PATHS = [
+    "/metrics/funnel",
+    "/metrics/kyc",
+    "/metrics/active-users?freq=D",
+    "/metrics/active-users?freq=W",
+    "/metrics/active-users?freq=M",
+    "/metrics/corridors",
+]
+
+
+def percentile(latencies: list, pct: float) -> float:
+    """Returns the nearest-rank percentile of the given latencies"""
+
+    ordered = sorted(latencies)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+async def worker(client: httpx.AsyncClient, paths: list, count: int, latencies: list):
+    """Issues `count` requests, cycling through the given paths"""
+
+    for i in range(count):
+        path = paths[i % len(paths)]
+        start = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(base_url: str, paths: list, concurrency: int, requests: int):
+    latencies = []
+    concurrency = max(1, min(concurrency, requests))
+    # Spread the requests so the total matches exactly
+    counts = [
+        requests // concurrency + (i < requests % concurrency)
+        for i in range(concurrency)
+    ]
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(worker(client, paths, count, latencies) for count in counts)
+        )
+        elapsed = time.perf_counter() - start
+
+    print(f"Requests:    {len(latencies)} ({concurrency} concurrent)")
+    print(f"Throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"Mean:        {statistics.mean(latencies) * 1000:.1f} ms")
+    print(f"p50 latency: {percentile(latencies, 50) * 1000:.1f} ms")
+    print(f"p99 latency: {percentile(latencies, 99) * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the aggregate API")
+    parser.add_argument("--url", default=f"http://{API_HOST}:{API_PORT}")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--format", choices=["json", "arrow"], default="json")
+    parser.add_argument(
+        "--path",
+        action="append",
+        dest="paths",
+        help="Endpoint path to hit; may be repeated (defaults to every metric)",
+    )
+    args = parser.parse_args()
+
+    paths = [
+        f"{path}{'&' if '?' in path else '?'}format={args.format}"
+        for path in (args.paths or DEFAULT_PATHS)
+    ]
+    asyncio.run(run(args.url, paths, args.concurrency, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+
+TOKEN_PATTERN = r"\w+"
+
+# Sorts after any token sharing the prefix, closing the prefix range
+PREFIX_SENTINEL = "\U0010ffff"
+
+
+def tokenize(text: str) -> list:
+    """Splits text into the lowercase tokens the index stores"""
+
+    return re.findall(TOKEN_PATTERN, str(text).lower())
+
+
+class Segment:
+    """
+    One immutable block of the inverted index: a sorted vocabulary, offsets
+    into a flat postings array, and the row ids (sorted per token).
+    """
+
+    def __init__(self, vocabulary, offsets, postings):
+        self.vocabulary = vocabulary
+        self.offsets = offsets
+        self.postings = postings
+
+    @classmethod
+    def build(cls, narrations: pd.Series, start_row: int) -> "Segment":
+        """
+        Indexes narrations as rows `start_row`, `start_row + 1`, ... Each
+        distinct narration is tokenized once; only the distinct tokens are
+        sorted as strings, and the token/row pairs are sorted as integers.
+        """
+
+        codes, uniques = pd.factorize(narrations.fillna("").astype(str))
+        tokens = pd.Series(uniques).str.lower().str.findall(TOKEN_PATTERN).explode()
+        token_codes = pd.DataFrame(
+            {"Token": tokens.to_numpy(), "Code": tokens.index.to_numpy()}
+        ).dropna().drop_duplicates()
+        token_codes["TokenId"], vocabulary = pd.factorize(
+            token_codes.pop("Token"), sort=True
+        )
+
+        rows = pd.DataFrame(
+            {"Code": codes, "Row": np.arange(len(codes), dtype=np.int64) + start_row}
+        )
+        # An inner merge keeps the left (row) order, so rows stay increasing
+        pairs = rows.merge(token_codes, on="Code")
+        return cls.from_token_ids(
+            np.asarray(vocabulary, dtype=str),
+            pairs["TokenId"].to_numpy(),
+            pairs["Row"].to_numpy(),
+        )
+
+    @classmethod
+    def from_token_ids(
+        cls, vocabulary: np.ndarray, token_ids: np.ndarray, rows: np.ndarray
+    ) -> "Segment":
+        """
+        Builds a segment from token id/row pairs, where token ids index the
+        sorted `vocabulary`. Pairs must be in increasing row order for a token.
+        """
+
+        order = np.argsort(token_ids, kind="stable")
+        counts = np.bincount(token_ids, minlength=len(vocabulary))
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        return cls(vocabulary, offsets, rows[order].astype(np.int64))
+
+    @classmethod
+    def empty(cls) -> "Segment":
+        """Builds a segment with no tokens"""
+
+        return cls(
+            np.array([], dtype=str),
+            np.zeros(1, dtype=np.int64),
+            np.array([], dtype=np.int64),
+        )
+
+    def lookup(self, lo: str, hi: str = None) -> np.ndarray:
+        """
+        Returns the postings of every token in the [lo, hi) vocabulary range,
+        or of the token `lo` alone when no `hi` is given.
+        """
+
+        first = np.searchsorted(self.vocabulary, lo, "left")
+        if hi is None:
+            last = np.searchsorted(self.vocabulary, lo, "right")
+        else:
+            last = np.searchsorted(self.vocabulary, hi, "left")
+        return self.postings[self.offsets[first] : self.offsets[last]]
+
+
+class NarrationIndex:
+    """
+    Inverted index over transaction Narration. New transactions are added as
+    segments whose row ids follow the existing ones, so updates never rebuild
+    what is already indexed; `save` merges the segments into one.
+    """
+
+    def __init__(self, segments: list = None, row_count: int = 0):
+        self.segments = segments or []
+        self.row_count = row_count
+
+    @classmethod
+    def load(cls, path: str, missing_ok: bool = False) -> "NarrationIndex":
+        """
+        Loads a saved index. A missing file raises FileNotFoundError unless
+        `missing_ok`, when an empty index is returned.
+        """
+
+        if not os.path.exists(path):
+            if missing_ok:
+                return cls()
+            raise FileNotFoundError(f"Narration index not found: {path}")
+        with np.load(path) as saved:
+            segment = Segment(saved["vocabulary"], saved["offsets"], saved["postings"])
+            return cls([segment], int(saved["row_count"]))
+
+    def add(self, narrations: pd.Series) -> int:
+        """Indexes narrations as the next rows; returns the first new row id"""
+
+        start_row = self.row_count
+        if len(narrations):
+            self.segments.append(Segment.build(narrations, start_row))
+            self.row_count += len(narrations)
+        return start_row
+
+    def compact(self):
+        """
+        Merges all segments into one. Each segment's vocabulary is mapped into
+        the merged vocabulary by binary search, so postings are regrouped by
+        integer token id without expanding tokens per posting.
+        """
+
+        if len(self.segments) <= 1:
+            return
+        vocabulary = np.unique(
+            np.concatenate([segment.vocabulary for segment in self.segments])
+        )
+        token_ids = np.concatenate(
+            [
+                np.repeat(
+                    np.searchsorted(vocabulary, segment.vocabulary),
+                    np.diff(segment.offsets),
+                )
+                for segment in self.segments
+            ]
+        )
+        # Segments hold increasing row ranges, so a stable sort on the token id
+        # alone keeps each token's rows in order
+        rows = np.concatenate([segment.postings for segment in self.segments])
+        self.segments = [Segment.from_token_ids(vocabulary, token_ids, rows)]
+
+    def save(self, path: str):
+        """Compacts the index and writes it to `path`"""
+
+        self.compact()
+        segment = self.segments[0] if self.segments else Segment.empty()
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                vocabulary=segment.vocabulary,
+                offsets=segment.offsets,
+                postings=segment.postings,
+                row_count=self.row_count,
+            )
+
+    def term(self, token: str) -> np.ndarray:
+        """Returns the sorted row ids whose narration contains `token`"""
+
+        return self._lookup(token.lower(), None, unique=False)
+
+    def prefix(self, prefix: str) -> np.ndarray:
+        """Returns the sorted row ids with a narration token starting with `prefix`"""
+
+        prefix = prefix.lower()
+        return self._lookup(prefix, prefix + PREFIX_SENTINEL, unique=True)
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        Returns the sorted row ids matching every word of `query`. Words ending
+        in '*' match as prefixes, e.g. 'educ* services'.
+        """
+
+        matches = []
+        for word in query.split():
+            # 'health-rel*' tokenizes to a term plus a prefix, both required
+            tokens = tokenize(word.rstrip("*"))
+            if not tokens:
+                continue
+            matches += [self.term(token) for token in tokens[:-1]]
+            if word.endswith("*"):
+                matches.append(self.prefix(tokens[-1]))
+            else:
+                matches.append(self.term(tokens[-1]))
+
+        if not matches:
+            return np.array([], dtype=np.int64)
+
+        # Intersect the rarest first so each step works on the smallest arrays
+        matches.sort(key=len)
+        rows = matches[0]
+        for other in matches[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows
+
+    def _lookup(self, lo: str, hi: str, unique: bool) -> np.ndarray:
+        parts = [segment.lookup(lo, hi) for segment in self.segments]
+        rows = np.concatenate(parts) if parts else np.array([], dtype=np.int64)
+        # A single term's postings are already sorted across segments; a
+        # prefix spans several terms and needs merging
+        return np.unique(rows) if unique else rows
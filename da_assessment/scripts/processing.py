@@ -1,17 +1,43 @@
+import os
 import numpy as np
 import pandas as pd
 from dashboard.utils.data_loader import load_data
+from da_assessment.scripts.demographics import (
+    age_group,
+    build_demographics_cube,
+    compute_age,
+)
+from da_assessment.scripts.features import update_user_features
+from da_assessment.scripts.identity import IdentityIndex
+from da_assessment.scripts.narration_index import NarrationIndex
+from da_assessment.scripts.validation import (
+    USER_FIELD_RULES,
+    USER_RULES,
+    ValidationStage,
+    transaction_rules,
+)
 from da_assessment.scripts.config import (
     UNPROCESSED_USER_DATA,
     UNPROCESSED_TRANSACTION_DATA,
     PROCESSED_USER_DATA,
     PROCESSED_TRANSACTION_DATA,
+    PROCESSED_DEMOGRAPHICS_CUBE,
+    IDENTITY_INDEX,
+    NARRATION_INDEX,
+    PROCESSED_USER_FEATURES,
+    QUARANTINED_USER_DATA,
+    QUARANTINED_TRANSACTION_DATA,
+    PROCESSING_CHUNKSIZE,
 )
 
 
 # Data Loading
+# Transactions are streamed in chunks so validation and writing never need
+# the whole table in memory
 _, user_df_copy = load_data(UNPROCESSED_USER_DATA)
-_, transaction_df_copy = load_data(UNPROCESSED_TRANSACTION_DATA)
+transaction_chunks = pd.read_csv(
+    UNPROCESSED_TRANSACTION_DATA, chunksize=PROCESSING_CHUNKSIZE
+)
 
 
 # User Table Preprocessing
@@ -59,23 +85,113 @@ user_df_copy["Occupation"] = user_df_copy["Occupation"].map(standardize_occupati
 
 
 # Transactions Table Preprocessing
-# Convert columns to specified data types
-transaction_df_copy["Id"] = transaction_df_copy["Id"].astype("object")
+def preprocess_transactions(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Applies the transaction cleaning steps to a chunk"""
+
+    # Convert columns to specified data types
+    chunk["Id"] = chunk["Id"].astype("object")
+
+    # Replacing nulls with "Unspecified" in the "Narration" column
+    chunk["Narration"] = chunk["Narration"].fillna("Unspecified")
+
+    return chunk
+
 
+# Data Validation
+# Failing rows (null ids, unparseable dates, null or negative amounts, orphan
+# transactions) are quarantined to side files instead of being dropped silently.
+# Unparseable birth dates are nulled so the user and their transactions are kept
+for path in [QUARANTINED_USER_DATA, QUARANTINED_TRANSACTION_DATA]:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
 
-# Remove nulls from the "UserId" column
-transaction_df_copy = transaction_df_copy.dropna(subset=["UserId"])
+user_validation = ValidationStage(
+    USER_RULES, QUARANTINED_USER_DATA, USER_FIELD_RULES
+)
+user_df_copy = user_validation.run(user_df_copy)
+
+transaction_validation = ValidationStage(
+    transaction_rules(user_df_copy["Id"]), QUARANTINED_TRANSACTION_DATA
+)
 
 
-# Replacing nulls with "Unspecified" in the "Narration" column
-transaction_df_copy["Narration"] = transaction_df_copy["Narration"].fillna(
-    "Unspecified"
+# Age and Demographic Binning
+# Ages are exact to the day as of the processing date, and the small
+# demographics cube lets the dashboard cross-filter without the user table
+user_df_copy["Age"] = compute_age(
+    user_df_copy["DateOfBirth"], pd.Timestamp.today().normalize()
 )
+user_df_copy["AgeGroup"] = age_group(user_df_copy["Age"])
+demographics_cube = build_demographics_cube(user_df_copy)
+
+
+# Identity Index
+# Normalized, hashed emails map to the accounts sharing them. The saved index
+# is extended with new users only, so reruns do not rebuild it; users that
+# were quarantined or removed since are pruned, and changed emails re-keyed
+identity_index = IdentityIndex.load(IDENTITY_INDEX, missing_ok=True)
+new_identities = identity_index.update(user_df_copy)
+
+
+# Storage is kept sorted by "DateCreated" so the dashboard can slice date
+# ranges by binary search (ISO dates sort lexicographically). Transactions are
+# sorted per chunk, so their file is only sorted as a whole when the raw table
+# is in date order; that is checked below rather than assumed
+user_df_copy = user_df_copy.sort_values("DateCreated", kind="stable")
 
 
 # Save the processed DataFrames as CSV files
 user_df_copy.to_csv(PROCESSED_USER_DATA, index=False)
-transaction_df_copy.to_csv(PROCESSED_TRANSACTION_DATA, index=False)
-
+demographics_cube.to_csv(PROCESSED_DEMOGRAPHICS_CUBE, index=False)
+identity_index.save(IDENTITY_INDEX)
+
+# The processed transactions file is regenerated from the raw table on every
+# run (validation depends on the current user table), so the narration index
+# is rebuilt alongside it: one segment per chunk, with row ids matching the
+# rows' positions in the file. Both are written from the same chunks
+narration_index = NarrationIndex()
+
+# Per-user transaction features (counts, amounts, first/last dates, active
+# days, volume segment) are folded in chunk by chunk, so the dashboard answers
+# per-user questions without grouping the transaction table. Like the
+# narration index, they are rebuilt with the processed file on every run
+user_features, user_days = None, None
+
+# Chunks starting before the latest date already written leave the file
+# unsorted; the dashboard then re-sorts it on load
+latest_date, overlapping_chunks = None, 0
+
+for i, chunk in enumerate(
+    transaction_validation.run_chunks(map(preprocess_transactions, transaction_chunks))
+):
+    chunk = chunk.sort_values("DateCreated", kind="stable")
+    if len(chunk):
+        first_date, last_date = chunk["DateCreated"].iloc[[0, -1]]
+        if latest_date is not None and first_date < latest_date:
+            overlapping_chunks += 1
+        latest_date = last_date if latest_date is None else max(latest_date, last_date)
+    chunk.to_csv(
+        PROCESSED_TRANSACTION_DATA,
+        mode="w" if i == 0 else "a",
+        header=i == 0,
+        index=False,
+    )
+    narration_index.add(chunk["Narration"])
+    user_features, user_days = update_user_features(user_features, user_days, chunk)
+
+narration_index.save(NARRATION_INDEX)
+user_features.to_csv(PROCESSED_USER_FEATURES, index=False)
+
+print(user_validation.report())
+print(transaction_validation.report())
 print(f"Processed user data saved to: {PROCESSED_USER_DATA}")
 print(f"Processed transaction data saved to: {PROCESSED_TRANSACTION_DATA}")
+if overlapping_chunks:
+    print(
+        f"Warning: raw transactions are not in date order ({overlapping_chunks} "
+        "chunks start before earlier ones end), so the processed transactions "
+        "are not sorted by DateCreated and the dashboard will sort them on load"
+    )
+print(f"Demographics cube saved to: {PROCESSED_DEMOGRAPHICS_CUBE}")
+print(f"Narration index saved to: {NARRATION_INDEX}")
+print(f"User features saved to: {PROCESSED_USER_FEATURES}")
+print(f"Identity index updated with {new_identities} users: {IDENTITY_INDEX}")
@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+
+# Rule factories
+# Each rule is a vectorized check returning a boolean Series that is True for
+# rows that pass, so a whole chunk is validated column-wise in one pass.
+def not_null(column: str):
+    """Rows must have a value in `column`"""
+
+    return lambda frame: frame[column].notna()
+
+
+def valid_date(column: str):
+    """Rows must have an ISO-8601 parseable date in `column`"""
+
+    return lambda frame: pd.to_datetime(
+        frame[column], errors="coerce", format="ISO8601"
+    ).notna()
+
+
+def non_negative(column: str):
+    """Rows must have a non-negative number in `column` (nulls are left to `not_null`)"""
+
+    return lambda frame: frame[column].isna() | (
+        pd.to_numeric(frame[column], errors="coerce") >= 0
+    )
+
+
+def references(column: str, values):
+    """Rows must reference one of `values` in `column` (nulls are left to `not_null`)"""
+
+    # Build the hash table once and reuse it for every chunk
+    lookup = pd.Index(pd.unique(np.asarray(values)))
+    return lambda frame: frame[column].isna() | (
+        lookup.get_indexer(frame[column]) >= 0
+    )
+
+
+USER_RULES = {
+    "null_id": not_null("Id"),
+    "invalid_date_created": valid_date("DateCreated"),
+}
+
+# A bad value in a field that is not a key is nulled rather than quarantining
+# the user, which would also orphan all of the user's transactions
+USER_FIELD_RULES = {
+    "invalid_date_of_birth": ("DateOfBirth", valid_date("DateOfBirth")),
+}
+
+
+def transaction_rules(user_ids) -> dict:
+    """Returns the transaction rules, checking UserId against the given user ids"""
+
+    return {
+        "null_user_id": not_null("UserId"),
+        "orphan_user_id": references("UserId", user_ids),
+        "invalid_date_created": valid_date("DateCreated"),
+        "null_send_amount": not_null("SendAmount"),
+        "null_receive_amount": not_null("ReceiveAmount"),
+        "null_base_amount": not_null("BaseAmount"),
+        "negative_send_amount": non_negative("SendAmount"),
+        "negative_receive_amount": non_negative("ReceiveAmount"),
+        "negative_base_amount": non_negative("BaseAmount"),
+    }
+
+
+class ValidationStage:
+    """
+    Applies a set of rules chunk by chunk, writing failing rows to a quarantine
+    file (with a 'FailedRules' column) and keeping per-rule failure counts.
+    Field rules map a rule name to a (column, check) pair; failing values in
+    rows that are kept are set to null instead.
+    """
+
+    def __init__(self, rules: dict, quarantine_path: str, field_rules: dict = None):
+        self.rules = rules
+        self.field_rules = field_rules or {}
+        self.quarantine_path = quarantine_path
+        self.counts = pd.Series(
+            0, index=list(rules) + list(self.field_rules), dtype="int64"
+        )
+        self.rows_checked = 0
+        self.rows_quarantined = 0
+        self._quarantine_started = False
+
+    def run(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Validates one chunk and returns the rows that passed every rule"""
+
+        failures = ~np.column_stack(
+            [np.asarray(check(chunk), dtype=bool) for check in self.rules.values()]
+        )
+        failed = failures.any(axis=1)
+
+        self.counts[list(self.rules)] += failures.sum(axis=0)
+        self.rows_checked += len(chunk)
+        self.rows_quarantined += int(failed.sum())
+        self._quarantine(chunk[failed], failures[failed])
+
+        return self._null_invalid_fields(chunk[~failed])
+
+    def run_chunks(self, chunks):
+        """Validates an iterable of chunks, yielding the valid part of each"""
+
+        for chunk in chunks:
+            yield self.run(chunk)
+
+    def report(self) -> str:
+        """Summarises the per-rule failure counts"""
+
+        lines = [
+            f"Validated {self.rows_checked} rows, "
+            f"quarantined {self.rows_quarantined} to: {self.quarantine_path}"
+        ]
+        lines += [
+            f"  {rule}: {count}" + (" (nulled)" if rule in self.field_rules else "")
+            for rule, count in self.counts.items()
+        ]
+        return "\n".join(lines)
+
+    def _null_invalid_fields(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        for rule, (column, check) in self.field_rules.items():
+            # Missing values are already null and are not counted as failures
+            invalid = chunk[column].notna() & ~np.asarray(check(chunk), dtype=bool)
+            self.counts[rule] += int(invalid.sum())
+            if invalid.any():
+                chunk = chunk.assign(**{column: chunk[column].mask(invalid)})
+        return chunk
+
+    def _quarantine(self, rows: pd.DataFrame, failures: np.ndarray):
+        rows = rows.copy()
+        failed_rules = pd.Series("", index=rows.index)
+        for rule, rule_failed in zip(self.rules, failures.T):
+            failed_rules = failed_rules.where(~rule_failed, failed_rules + rule + ";")
+        rows["FailedRules"] = failed_rules.str.rstrip(";")
+
+        # The first chunk truncates the file so rows from earlier runs never linger
+        rows.to_csv(
+            self.quarantine_path,
+            mode="a" if self._quarantine_started else "w",
+            header=not self._quarantine_started,
+            index=False,
+        )
+        self._quarantine_started = True
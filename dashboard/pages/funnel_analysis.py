@@ -3,14 +3,31 @@ import pandas as pd
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
-from dashboard.utils.data_loader import load_data
-from da_assessment.scripts.config import (
-    PROCESSED_USER_DATA,
-    PROCESSED_TRANSACTION_DATA,
+from dashboard.utils.figures import cached_figure
+from dashboard.utils.filters import (
+    FILTER_CACHE_ENTRIES,
+    Filters,
+    filtered_users,
+    filtered_transactions,
+    filtered_user_features,
 )
+from da_assessment.scripts.aggregates import funnel_counts
 
 
-def show():
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_funnel(filters: Filters) -> pd.DataFrame:
+    """Counts users at each funnel stage for the filtered views"""
+
+    # Only transacting user ids are needed: the precomputed feature table has
+    # them unless a filter narrows transactions, when the view is cheaper
+    if filters.is_transaction_filtered:
+        transactions = filtered_transactions(filters)
+    else:
+        transactions = filtered_user_features(filters)
+    return funnel_counts(filtered_users(filters), transactions)
+
+
+def show(filters: Filters):
     st.title("Funnel Analysis")
     st.markdown(
         "This section analyzes user activity across different stages: "
@@ -19,45 +36,7 @@ def show():
         "we can identify potential bottlenecks and improve user onboarding processes."
     )
 
-    _, users_df_copy = load_data(PROCESSED_USER_DATA)
-    _, transactions_df_copy = load_data(PROCESSED_TRANSACTION_DATA)
-
-    # Funnel Stages
-    total_acquired = users_df_copy.shape[0]
-    total_completed_profile = users_df_copy[
-        users_df_copy["CompletedProfile"] == True
-    ].shape[0]
-    total_kyc_verified = users_df_copy[users_df_copy["IsKYCVerified"] == True].shape[0]
-
-    # Find users who are KYC Verified & Transacting
-    merged_df = transactions_df_copy.merge(
-        users_df_copy[["Id", "IsKYCVerified"]],
-        left_on="UserId",
-        right_on="Id",
-        how="inner",
-    )
-
-    # Filter only KYC Verified Users who are Transacting
-    kyc_verified_transacting_users = merged_df[merged_df["IsKYCVerified"] == True][
-        "UserId"
-    ].nunique()
-
-    funnel_data = pd.DataFrame(
-        {
-            "Stage": [
-                "Acquisition",
-                "Complete Profile",
-                "KYC Verified",
-                "Transaction",
-            ],
-            "Users": [
-                total_acquired,
-                total_completed_profile,
-                total_kyc_verified,
-                kyc_verified_transacting_users,
-            ],
-        }
-    )
+    funnel_data = compute_funnel(filters)
 
     # Fixing Conversion Rate Calculation
     funnel_data["Conversion Rate"] = (
@@ -78,7 +57,8 @@ def show():
     funnel_data.loc[len(funnel_data) - 1, "Drop Off"] = 100
 
     # Funnel Chart
-    fig = px.funnel(
+    fig = cached_figure(
+        px.funnel,
         funnel_data,
         x="Users",
         y="Stage",
@@ -3,13 +3,36 @@ import pandas as pd
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
-from dashboard.utils.data_loader import load_data
-from da_assessment.scripts.config import (
-    PROCESSED_USER_DATA,
-)
+from dashboard.utils.figures import cached_figure
+from dashboard.utils.filters import FILTER_CACHE_ENTRIES, Filters, filtered_users
+from da_assessment.scripts.aggregates import KYC_STATUS_LABELS, kyc_distribution
 
 
-def show():
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_kyc(filters: Filters) -> tuple:
+    """Computes the KYC status distribution and daily trend for the filtered users"""
+
+    users = filtered_users(filters)
+
+    # KYC Status Distribution (Sorted from Highest to Lowest)
+    kyc_counts = kyc_distribution(users)
+
+    # KYC Trend Over Time
+    kyc_trend = (
+        users.groupby(
+            [
+                users["DateCreated"].dt.date.rename("DateOnly"),
+                users["KycStatus"].map(KYC_STATUS_LABELS).rename("KYCStatusMapped"),
+            ]
+        )
+        .size()
+        .reset_index(name="Count")
+    )
+
+    return kyc_counts, kyc_trend
+
+
+def show(filters: Filters):
     st.title("KYC Status Dashboard 🔍")
     st.markdown(
         """
@@ -27,26 +50,10 @@ def show():
     """
     )
 
-    _, users_df_copy = load_data(PROCESSED_USER_DATA)
-
-    kyc_mapping = {
-        1: "Not Started",
-        2: "Pending",
-        3: "Passed",
-        4: "In Review",
-        5: "Unspecified",
-        6: "Failed",
-    }
-
-    users_df_copy["KYCStatusMapped"] = users_df_copy["KycStatus"].map(kyc_mapping)
-    users_df_copy["DateCreated"] = pd.to_datetime(users_df_copy["DateCreated"])
+    kyc_counts, kyc_trend = compute_kyc(filters)
 
-    # KYC Status Distribution (Sorted from Highest to Lowest)
-    kyc_counts = users_df_copy["KYCStatusMapped"].value_counts().reset_index()
-    kyc_counts.columns = ["KYC Status", "User Count"]
-    kyc_counts = kyc_counts.sort_values(by="User Count", ascending=False)
-
-    fig_count = px.bar(
+    fig_count = cached_figure(
+        px.bar,
         kyc_counts,
         x="KYC Status",
         y="User Count",
@@ -56,15 +63,8 @@ def show():
     )
     st.plotly_chart(fig_count)
 
-    # KYC Trend Over Time
-    users_df_copy["DateOnly"] = users_df_copy["DateCreated"].dt.date
-    kyc_trend = (
-        users_df_copy.groupby(["DateOnly", "KYCStatusMapped"])
-        .size()
-        .reset_index(name="Count")
-    )
-
-    fig_trend = px.line(
+    fig_trend = cached_figure(
+        px.line,
         kyc_trend,
         x="DateOnly",
         y="Count",
@@ -1,15 +1,45 @@
 import numpy as np
-import pandas as pd
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
-from dashboard.utils.data_loader import load_data
-from da_assessment.scripts.config import (
-    PROCESSED_TRANSACTION_DATA,
+from dashboard.utils.figures import cached_figure
+from dashboard.utils.filters import (
+    FILTER_CACHE_ENTRIES,
+    Filters,
+    filtered_transactions,
+    filtered_user_features,
 )
+from da_assessment.scripts.aggregates import active_users
 
 
-def show():
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_retention(filters: Filters) -> dict:
+    """
+    Computes daily, weekly and monthly active users and the transaction volume
+    segmentation for the filtered transactions. The weekly and monthly counts
+    are computed once and shared by the trend and count charts.
+    """
+
+    transactions = filtered_transactions(filters)
+
+    # User Segmentation by Transaction Volume, read from the per-user features
+    user_transaction_distribution = (
+        filtered_user_features(filters)["Segment"].value_counts().reset_index()
+    )
+    user_transaction_distribution.columns = [
+        "Transaction Volume Category",
+        "User Count",
+    ]
+
+    return {
+        "daily": active_users(transactions, "D"),
+        "weekly": active_users(transactions, "W"),
+        "monthly": active_users(transactions, "M"),
+        "segments": user_transaction_distribution,
+    }
+
+
+def show(filters: Filters):
     st.title("Retention Analysis Dashboard 🔁")
     st.markdown(
         """
@@ -19,77 +49,37 @@ def show():
         """
     )
 
-    _, transactions_df_copy = load_data(PROCESSED_TRANSACTION_DATA)
-
-    # Convert DateCreated column to datetime
-    transactions_df_copy["DateCreated"] = pd.to_datetime(
-        transactions_df_copy["DateCreated"]
-    )
-
-    # Extract week and month timestamps for grouping
-    transactions_df_copy["TransactionWeek"] = (
-        transactions_df_copy["DateCreated"].dt.to_period("W").dt.to_timestamp()
-    )
-    transactions_df_copy["TransactionMonth"] = (
-        transactions_df_copy["DateCreated"].dt.to_period("M").dt.to_timestamp()
-    )
-
-    # Weekly and Monthly Active Users
-    weekly_active_users = (
-        transactions_df_copy.groupby("TransactionWeek")["UserId"]
-        .nunique()
-        .reset_index()
-    )
-    monthly_active_users = (
-        transactions_df_copy.groupby("TransactionMonth")["UserId"]
-        .nunique()
-        .reset_index()
-    )
+    aggregates = compute_retention(filters)
+    daily_transactions = aggregates["daily"]
+    weekly_transactions = aggregates["weekly"]
+    monthly_transactions = aggregates["monthly"]
 
     # Plot Weekly Active Users
-    fig_weekly = px.line(
-        weekly_active_users,
-        x="TransactionWeek",
-        y="UserId",
+    fig_weekly = cached_figure(
+        px.line,
+        weekly_transactions,
+        x="Week",
+        y="Active Users",
         title="Weekly Active Users Trend",
         markers=True,
-        labels={"UserId": "Active Users", "TransactionWeek": "Week"},
     )
     st.plotly_chart(fig_weekly, use_container_width=True)
 
     # Plot Monthly Active Users
-    fig_monthly = px.line(
-        monthly_active_users,
-        x="TransactionMonth",
-        y="UserId",
+    fig_monthly = cached_figure(
+        px.line,
+        monthly_transactions,
+        x="Month",
+        y="Active Users",
         title="Monthly Active Users Trend",
         markers=True,
-        labels={"UserId": "Active Users", "TransactionMonth": "Month"},
     )
     st.plotly_chart(fig_monthly, use_container_width=True)
 
-    # User Segmentation by Transaction Volume
-    user_transaction_counts = (
-        transactions_df_copy.groupby("UserId")
-        .size()
-        .reset_index(name="TransactionCount")
-    )
-    user_transaction_counts["Category"] = pd.cut(
-        user_transaction_counts["TransactionCount"],
-        bins=[0, 3, 5, 10, 20, float("inf")],
-        labels=["1-3", "4-5", "6-10", "11-20", "20+"],
-    )
-    user_transaction_distribution = (
-        user_transaction_counts["Category"].value_counts().reset_index()
-    )
-    user_transaction_distribution.columns = [
-        "Transaction Volume Category",
-        "User Count",
-    ]
-
     # Plot User Segmentation
-    fig_category = px.bar(
-        user_transaction_distribution,
+    fig_category = cached_figure(
+        px.bar,
+        aggregates["segments"],
         x="Transaction Volume Category",
         y="User Count",
         text="User Count",
@@ -102,31 +92,9 @@ def show():
     )
     st.plotly_chart(fig_category, use_container_width=True)
 
-    # Daily, Weekly, and Monthly Insights
-    daily_transactions = (
-        transactions_df_copy.groupby(transactions_df_copy["DateCreated"].dt.date)[
-            "UserId"
-        ]
-        .nunique()
-        .reset_index()
-    )
-    weekly_transactions = (
-        transactions_df_copy.groupby("TransactionWeek")["UserId"]
-        .nunique()
-        .reset_index()
-    )
-    monthly_transactions = (
-        transactions_df_copy.groupby("TransactionMonth")["UserId"]
-        .nunique()
-        .reset_index()
-    )
-
-    daily_transactions.columns = ["Date", "Active Users"]
-    weekly_transactions.columns = ["Week", "Active Users"]
-    monthly_transactions.columns = ["Month", "Active Users"]
-
     # Plot Daily Active Users
-    fig_daily = px.line(
+    fig_daily = cached_figure(
+        px.line,
         daily_transactions,
         x="Date",
         y="Active Users",
@@ -136,7 +104,8 @@ def show():
     st.plotly_chart(fig_daily, use_container_width=True)
 
     # Plot Weekly Active Users Count
-    fig_weekly_detailed = px.bar(
+    fig_weekly_detailed = cached_figure(
+        px.bar,
         weekly_transactions,
         x="Week",
         y="Active Users",
@@ -146,7 +115,8 @@ def show():
     st.plotly_chart(fig_weekly_detailed, use_container_width=True)
 
     # Plot Monthly Active Users Count
-    fig_monthly_detailed = px.bar(
+    fig_monthly_detailed = cached_figure(
+        px.bar,
         monthly_transactions,
         x="Month",
         y="Active Users",
@@ -4,11 +4,79 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-from dashboard.utils.data_loader import load_data
-from da_assessment.scripts.config import PROCESSED_TRANSACTION_DATA
+from dashboard.utils.figures import cached_figure
+from dashboard.utils.filters import FILTER_CACHE_ENTRIES, Filters, filtered_transactions
+from da_assessment.scripts.aggregates import corridor_volumes
 
 
-def show():
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_transactions(filters: Filters) -> dict:
+    """Computes the transaction volume aggregates for the filtered transactions"""
+
+    transactions = filtered_transactions(filters)
+
+    send_currency_volume = (
+        transactions.groupby("SendCurrencyId")["SendAmount"].sum().reset_index()
+    )
+    send_currency_volume.columns = ["Send Currency", "Total Volume"]
+    send_currency_volume = send_currency_volume.sort_values(
+        by="Total Volume",
+        ascending=False,
+    )
+
+    monthly_corridor_volume = (
+        transactions.groupby(
+            [
+                transactions["DateCreated"]
+                .dt.to_period("M")
+                .rename("Transaction Month"),
+                "SendCurrencyId",
+                "ReceiveCurrencyId",
+            ]
+        )["SendAmount"]
+        .sum()
+        .reset_index()
+    )
+    monthly_corridor_volume["Transaction Month"] = monthly_corridor_volume[
+        "Transaction Month"
+    ].astype(str)
+    monthly_corridor_volume["MoMGrowth"] = (
+        monthly_corridor_volume.groupby(["SendCurrencyId", "ReceiveCurrencyId"])[
+            "SendAmount"
+        ].pct_change()
+        * 100
+    )
+
+    daily_transactions = (
+        transactions.groupby(
+            transactions["DateCreated"].dt.date.rename("Transaction Date")
+        )
+        .agg({"SendAmount": "sum", "Id": "count"})
+        .reset_index()
+    )
+    daily_transactions.columns = [
+        "Transaction Date",
+        "Total Volume",
+        "Transaction Count",
+    ]
+    daily_transactions["WoWGrowth"] = (
+        daily_transactions["Total Volume"].pct_change(periods=7) * 100
+    )
+    daily_transactions["MoMGrowth"] = (
+        daily_transactions["Total Volume"].pct_change(periods=30) * 100
+    )
+
+    return {
+        "total_transactions": transactions.shape[0],
+        "total_transaction_value": transactions["BaseAmount"].sum(),
+        "send_currency_volume": send_currency_volume,
+        "currency_corridor_volume": corridor_volumes(transactions),
+        "monthly_corridor_volume": monthly_corridor_volume,
+        "daily_transactions": daily_transactions,
+    }
+
+
+def show(filters: Filters):
     st.title("Transaction Analysis Dashboard 🚀")
     st.markdown(
         """
@@ -17,11 +85,11 @@ def show():
         """
     )
 
-    _, transactions_df_copy = load_data(PROCESSED_TRANSACTION_DATA)
+    aggregates = compute_transactions(filters)
 
     st.subheader("Key Metrics")
-    total_transactions = transactions_df_copy.shape[0]
-    total_transaction_value = transactions_df_copy["BaseAmount"].sum()
+    total_transactions = aggregates["total_transactions"]
+    total_transaction_value = aggregates["total_transaction_value"]
 
     fig = go.Figure()
     fig.add_trace(
@@ -42,16 +110,10 @@ def show():
     )
     st.plotly_chart(fig, use_container_width=False)
 
-    send_currency_volume = (
-        transactions_df_copy.groupby("SendCurrencyId")["SendAmount"].sum().reset_index()
-    )
-    send_currency_volume.columns = ["Send Currency", "Total Volume"]
-    send_currency_volume = send_currency_volume.sort_values(
-        by="Total Volume",
-        ascending=False,
-    )
+    send_currency_volume = aggregates["send_currency_volume"]
 
-    fig_send_currency = px.bar(
+    fig_send_currency = cached_figure(
+        px.bar,
         send_currency_volume,
         x="Send Currency",
         y="Total Volume",
@@ -60,24 +122,10 @@ def show():
     )
     st.plotly_chart(fig_send_currency)
 
-    currency_corridor_volume = (
-        transactions_df_copy.groupby(["SendCurrencyId", "ReceiveCurrencyId"])[
-            "SendAmount"
-        ]
-        .sum()
-        .reset_index()
-    )
-    currency_corridor_volume.columns = [
-        "Send Currency",
-        "Receive Currency",
-        "Total Volume",
-    ]
-    currency_corridor_volume = currency_corridor_volume.sort_values(
-        by="Total Volume",
-        ascending=False,
-    )
+    currency_corridor_volume = aggregates["currency_corridor_volume"]
 
-    fig_currency_corridor = px.bar(
+    fig_currency_corridor = cached_figure(
+        px.bar,
         currency_corridor_volume,
         x="Receive Currency",
         y="Total Volume",
@@ -88,26 +136,9 @@ def show():
     )
     st.plotly_chart(fig_currency_corridor)
 
-    transactions_df_copy["Transaction Month"] = pd.to_datetime(
-        transactions_df_copy["DateCreated"]
-    ).dt.to_period("M")
-    monthly_corridor_volume = (
-        transactions_df_copy.groupby(
-            ["Transaction Month", "SendCurrencyId", "ReceiveCurrencyId"]
-        )["SendAmount"]
-        .sum()
-        .reset_index()
-    )
-    monthly_corridor_volume["Transaction Month"] = monthly_corridor_volume[
-        "Transaction Month"
-    ].astype(str)
-    monthly_corridor_volume["MoMGrowth"] = (
-        monthly_corridor_volume.groupby(["SendCurrencyId", "ReceiveCurrencyId"])[
-            "SendAmount"
-        ].pct_change()
-        * 100
-    )
-    fig_mom_growth = px.line(
+    monthly_corridor_volume = aggregates["monthly_corridor_volume"]
+    fig_mom_growth = cached_figure(
+        px.line,
         monthly_corridor_volume,
         x="Transaction Month",
         y="MoMGrowth",
@@ -118,22 +149,9 @@ def show():
     st.plotly_chart(fig_mom_growth)
 
     with st.expander("Transaction Trends Over Time"):
-        transactions_df_copy["Transaction Date"] = pd.to_datetime(
-            transactions_df_copy["DateCreated"]
-        ).dt.date
-        transactions = (
-            transactions_df_copy.groupby("Transaction Date")
-            .agg({"SendAmount": "sum", "Id": "count"})
-            .reset_index()
-        )
-        transactions.columns = ["Transaction Date", "Total Volume", "Transaction Count"]
-        transactions["WoWGrowth"] = (
-            transactions["Total Volume"].pct_change(periods=7) * 100
-        )
-        transactions["MoMGrowth"] = (
-            transactions["Total Volume"].pct_change(periods=30) * 100
-        )
-        fig_trend = px.line(
+        transactions = aggregates["daily_transactions"]
+        fig_trend = cached_figure(
+            px.line,
             transactions,
             x="Transaction Date",
             y="Total Volume",
@@ -141,7 +159,8 @@ def show():
             markers=True,
         )
         st.plotly_chart(fig_trend)
-        fig_wow_mom = px.line(
+        fig_wow_mom = cached_figure(
+            px.line,
             transactions,
             x="Transaction Date",
             y=["WoWGrowth", "MoMGrowth"],
@@ -4,14 +4,97 @@ import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
-from dashboard.utils.data_loader import load_data
-from da_assessment.scripts.config import (
-    PROCESSED_USER_DATA,
-    PROCESSED_TRANSACTION_DATA,
+from dashboard.utils.data_loader import load_data, load_identity_index
+from dashboard.utils.figures import cached_figure
+from dashboard.utils.filters import (
+    FILTER_CACHE_ENTRIES,
+    Filters,
+    filtered_users,
+    filtered_transactions,
 )
+from da_assessment.scripts.demographics import (
+    build_demographics_cube,
+    order_age_groups,
+)
+from da_assessment.scripts.config import PROCESSED_DEMOGRAPHICS_CUBE
+
+
+def count_multiple_accounts(users_df: pd.DataFrame, filters: Filters) -> int:
+    """
+    Counts identities with more than one account. Unfiltered, this is read
+    straight off the identity index; filtered, only the narrowed users' keys
+    are looked up.
+    """
+
+    identity_index = load_identity_index()
+    if not filters.is_user_filtered:
+        return identity_index.multi_account_count
+
+    user_keys = identity_index.user_keys
+    keys = pd.Series(
+        [user_keys[user_id] for user_id in users_df["Id"] if user_id in user_keys],
+        dtype="int64",
+    )
+    return int((keys.value_counts() > 1).sum())
+
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_users(filters: Filters) -> dict:
+    """Computes the user metrics and daily KYC growth for the filtered users"""
+
+    users_df = filtered_users(filters)
+
+    daily_kyc = (
+        users_df.groupby([users_df["DateCreated"].dt.date, "IsKYCVerified"])
+        .size()
+        .unstack(fill_value=0)
+        .reindex(columns=[True, False], fill_value=0)
+        .reset_index()
+    )
+    daily_kyc["Verified WoW Growth"] = daily_kyc[True].pct_change(periods=7) * 100
+    daily_kyc["Non-Verified WoW Growth"] = daily_kyc[False].pct_change(periods=7) * 100
+
+    return {
+        "total_users": users_df["Id"].nunique(),
+        "multiple_accounts": count_multiple_accounts(users_df, filters),
+        "daily_kyc": daily_kyc,
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_demographics(filters: Filters) -> pd.DataFrame:
+    """
+    Returns the demographics cube narrowed to the filters. The cube has no date
+    dimension, so a date range rebuilds it from the (already narrowed) users.
+    """
+
+    if filters.is_date_filtered:
+        return order_age_groups(build_demographics_cube(filtered_users(filters)))
 
+    _, cube = load_data(PROCESSED_DEMOGRAPHICS_CUBE)
+    if filters.countries:
+        cube = cube[cube["ResidenceCountry"].isin(filters.countries)]
+    if filters.kyc_statuses:
+        cube = cube[cube["KycStatus"].isin(filters.kyc_statuses)]
+    return order_age_groups(cube.copy())
 
-def show():
+
+@st.cache_data(show_spinner=False, max_entries=FILTER_CACHE_ENTRIES)
+def compute_daily_volume(filters: Filters) -> pd.DataFrame:
+    """Computes the daily average transaction volume per user"""
+
+    transactions_df = filtered_transactions(filters)
+
+    # The mean of per-user daily sums is the daily total over the day's users,
+    # so no per-user grouping is needed
+    daily_trans = transactions_df.groupby(transactions_df["DateCreated"].dt.date).agg(
+        Total=("BaseAmount", "sum"), Users=("UserId", "nunique")
+    )
+    daily_trans["BaseAmount"] = daily_trans["Total"] / daily_trans["Users"]
+    return daily_trans["BaseAmount"].reset_index()
+
+
+def show(filters: Filters):
     st.title("User Analytics Dashboard 📈")
     st.markdown(
         """
@@ -21,14 +104,12 @@ def show():
     )
 
     # Load Data
-    _, users_df = load_data(PROCESSED_USER_DATA)
-    _, transactions_df = load_data(PROCESSED_TRANSACTION_DATA)
+    metrics = compute_users(filters)
 
     # Top Metrics Section
     st.subheader("Key Metrics")
-    total_users = users_df["Id"].nunique()
-    username_counts = users_df.groupby("UserName")["Id"].nunique().reset_index()
-    multiple_accounts = username_counts[username_counts["Id"] > 1].shape[0]
+    total_users = metrics["total_users"]
+    multiple_accounts = metrics["multiple_accounts"]
 
     fig = go.Figure()
     fig.add_trace(
@@ -49,19 +130,27 @@ def show():
     )
     st.plotly_chart(fig, use_container_width=False)
 
+    # Expandable Section: Multiple Accounts
+    # Clusters come from the identity index built at ingest, so emails that
+    # differ only by case, dots or '+tags' are grouped together
+    with st.expander("Multiple Account Clusters"):
+        identity_index = load_identity_index()
+        lookup_id = st.text_input("Find accounts sharing a user's identity (User Id)")
+        if lookup_id:
+            duplicates = identity_index.duplicates_of(lookup_id.strip())
+            st.write(duplicates if duplicates else "No other accounts found.")
+
+        clusters = identity_index.clusters()
+        st.dataframe(clusters[["NormalizedEmail", "Accounts", "UserIds"]].head(100))
+
     # Two-Column Layout: KYC Trends vs Growth Metrics
     st.subheader("User Verification Trends & Growth Metrics")
     col1, col2 = st.columns(2)
 
-    users_df["DateCreated"] = pd.to_datetime(users_df["DateCreated"], errors="coerce")
-    daily_kyc = (
-        users_df.groupby([users_df["DateCreated"].dt.date, "IsKYCVerified"])
-        .size()
-        .unstack(fill_value=0)
-        .reset_index()
-    )
+    daily_kyc = metrics["daily_kyc"]
 
-    fig_kyc = px.line(
+    fig_kyc = cached_figure(
+        px.line,
         daily_kyc,
         x="DateCreated",
         y=[True, False],
@@ -71,10 +160,8 @@ def show():
     )
     col1.plotly_chart(fig_kyc, use_container_width=True)
 
-    daily_kyc["Verified WoW Growth"] = daily_kyc[True].pct_change(periods=7) * 100
-    daily_kyc["Non-Verified WoW Growth"] = daily_kyc[False].pct_change(periods=7) * 100
-
-    fig_growth = px.line(
+    fig_growth = cached_figure(
+        px.line,
         daily_kyc,
         x="DateCreated",
         y=["Verified WoW Growth", "Non-Verified WoW Growth"],
@@ -85,22 +172,17 @@ def show():
     col2.plotly_chart(fig_growth, use_container_width=True)
 
     # Expandable Section: Demographics
+    # Served from the precomputed demographics cube rather than the user table
     with st.expander("User Demographics"):
+        cube = compute_demographics(filters)
+
         st.subheader("Age Distribution")
-        users_df["DateOfBirth"] = pd.to_datetime(
-            users_df["DateOfBirth"], errors="coerce"
-        )
-        current_year = datetime.now().year
-        users_df["Age"] = current_year - users_df["DateOfBirth"].dt.year
-        bins = [0, 17, 25, 35, 45, 55, 65, 100]
-        labels = ["<18", "18-25", "26-35", "36-45", "46-55", "56-65", "65+"]
-        users_df["AgeGroup"] = pd.cut(
-            users_df["Age"], bins=bins, labels=labels, right=True
+        age_dist = (
+            cube.groupby("AgeGroup", observed=False)["Users"].sum().reset_index()
         )
-
-        age_dist = users_df["AgeGroup"].value_counts().reset_index()
         age_dist.columns = ["AgeGroup", "count"]
-        fig_age = px.bar(
+        fig_age = cached_figure(
+            px.bar,
             age_dist,
             x="AgeGroup",
             y="count",
@@ -110,9 +192,10 @@ def show():
         st.plotly_chart(fig_age, use_container_width=True)
 
         st.subheader("Gender Distribution")
-        gender_dist = users_df["Gender"].value_counts().reset_index()
+        gender_dist = cube.groupby("Gender")["Users"].sum().reset_index()
         gender_dist.columns = ["Gender", "count"]
-        fig_gender = px.pie(
+        fig_gender = cached_figure(
+            px.pie,
             gender_dist,
             names="Gender",
             values="count",
@@ -123,18 +206,9 @@ def show():
     # Expandable Section: Transaction Insights
     with st.expander("Transaction Insights"):
         st.subheader("Daily Average Transaction Volume per User")
-        transactions_df["DateCreated"] = pd.to_datetime(transactions_df["DateCreated"])
-        daily_trans = (
-            transactions_df.groupby([transactions_df["DateCreated"].dt.date, "UserId"])[
-                "BaseAmount"
-            ]
-            .sum()
-            .reset_index()
-        )
-        daily_avg_vol = (
-            daily_trans.groupby("DateCreated")["BaseAmount"].mean().reset_index()
-        )
-        fig_avg_vol = px.line(
+        daily_avg_vol = compute_daily_volume(filters)
+        fig_avg_vol = cached_figure(
+            px.line,
             daily_avg_vol,
             x="DateCreated",
             y="BaseAmount",
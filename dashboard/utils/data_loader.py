@@ -1,8 +1,14 @@
 import pandas as pd
 import streamlit as st
+from da_assessment.scripts.features import read_user_features
+from da_assessment.scripts.identity import IdentityIndex
+from da_assessment.scripts.narration_index import NarrationIndex
 from da_assessment.scripts.config import (
     PROCESSED_USER_DATA,
     PROCESSED_TRANSACTION_DATA,
+    IDENTITY_INDEX,
+    NARRATION_INDEX,
+    PROCESSED_USER_FEATURES,
 )
 
 
@@ -15,3 +21,33 @@ def load_data(file_path):
     data = pd.read_csv(file_path)
     copy = data.copy()
     return data, copy
+
+
+@st.cache_resource
+def load_identity_index():
+    """
+    Loads the identity index built during preprocessing, raising if it has not
+    been built. It is shared across sessions and must not be modified.
+    """
+
+    return IdentityIndex.load(IDENTITY_INDEX)
+
+
+@st.cache_resource
+def load_narration_index():
+    """
+    Loads the narration index built during preprocessing, raising if it has not
+    been built. It is shared across sessions and must not be modified.
+    """
+
+    return NarrationIndex.load(NARRATION_INDEX)
+
+
+@st.cache_resource
+def load_user_features():
+    """
+    Loads the per-user feature table built during preprocessing. It is shared
+    across sessions and must not be modified.
+    """
+
+    return read_user_features(PROCESSED_USER_FEATURES)
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+
+
+FIGURE_CACHE_SIZE = 256
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+# Per-chart build/serialize timings and payload size, keyed by chart title.
+# Only recorded when enabled (by the benchmark), as it serializes every new figure
+RECORD_FIGURE_STATS = False
+FIGURE_STATS = {}
+
+
+def aggregate_hash(frame: pd.DataFrame) -> str:
+    """Hashes the values, column names and dtypes of an aggregate"""
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    digest.update(repr(list(zip(frame.columns, frame.dtypes.astype(str)))).encode())
+    return digest.hexdigest()
+
+
+def figure_key(builder, frame: pd.DataFrame, params: dict) -> str:
+    """Builds the cache key from the chart type, aggregate and layout parameters"""
+
+    layout = json.dumps(params, sort_keys=True, default=str)
+    return f"{builder.__module__}.{builder.__name__}:{aggregate_hash(frame)}:{layout}"
+
+
+def date_milliseconds(values):
+    """Converts an array of dates to milliseconds since epoch, or returns None"""
+
+    if not isinstance(values, np.ndarray) or values.ndim != 1 or values.size == 0:
+        return None
+    if pd.api.types.infer_dtype(values, skipna=False) not in (
+        "date",
+        "datetime",
+        "datetime64",
+    ):
+        return None
+    return pd.to_datetime(values).to_numpy("datetime64[ms]").astype("int64")
+
+
+def compact_figure(figure):
+    """
+    Sends date x values as millisecond timestamps, which plotly.js reads on a
+    'date' axis, in place. Plotly already encodes numeric arrays as base64
+    typed arrays, while dates would otherwise go out as ISO strings.
+    """
+
+    for trace in figure.data:
+        if "x" in trace:
+            milliseconds = date_milliseconds(trace.x)
+            if milliseconds is not None:
+                trace.x = milliseconds.astype("float64")
+                axis = "xaxis" + (trace.xaxis or "x")[1:]
+                figure.layout[axis].type = "date"
+    return figure
+
+
+def cached_figure(builder, frame: pd.DataFrame, **params):
+    """
+    Returns `builder(frame, **params)` (a Plotly Express function), reusing the
+    figure built for an identical aggregate and layout on earlier reruns.
+
+    Figures are compacted once when built, so Streamlit's per-render
+    serialization ships date axes as typed timestamps instead of strings.
+    Treat the returned figure as read-only.
+    """
+
+    key = figure_key(builder, frame, params)
+    with _lock:
+        figure = _cache.get(key)
+        if figure is not None:
+            _cache.move_to_end(key)
+            return figure
+
+    start = time.perf_counter()
+    figure = compact_figure(builder(frame, **params))
+    if RECORD_FIGURE_STATS:
+        record_figure_stats(params.get("title", key), figure, start)
+
+    with _lock:
+        _cache[key] = figure
+        while len(_cache) > FIGURE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return figure
+
+
+def record_figure_stats(name: str, figure, start: float):
+    """Records build and serialize timings and payload sizes for one chart"""
+
+    built = time.perf_counter()
+    payload = pio.to_json(figure, validate=False)
+    serialized = time.perf_counter()
+
+    FIGURE_STATS[name] = {
+        "build_ms": (built - start) * 1000,
+        "serialize_ms": (serialized - built) * 1000,
+        "payload_bytes": len(payload),
+    }
+
+
+def clear_figure_cache():
+    """Empties the figure cache and the recorded timings"""
+
+    with _lock:
+        _cache.clear()
+        FIGURE_STATS.clear()
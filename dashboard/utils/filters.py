@@ -0,0 +1,188 @@
+from dataclasses import dataclass
+
+import pandas as pd
+import streamlit as st
+from dashboard.utils.data_loader import load_narration_index, load_user_features
+from dashboard.utils.indexed_frame import IndexedFrame
+from da_assessment.scripts.aggregates import KYC_STATUS_LABELS
+from da_assessment.scripts.features import build_user_features
+from da_assessment.scripts.config import (
+    PROCESSED_USER_DATA,
+    PROCESSED_TRANSACTION_DATA,
+)
+
+
+# Bounds the per-filter caches of the page aggregates. Every distinct filter
+# combination (including free-text narration searches) gets its own entry
+FILTER_CACHE_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class Filters:
+    """
+    Global sidebar filter state. It is hashable, so pages pass it to their
+    cached aggregate functions and each filter combination gets its own entry.
+    """
+
+    start_date: object = None
+    end_date: object = None
+    countries: tuple = ()
+    kyc_statuses: tuple = ()
+    corridors: tuple = ()
+    narration: str = ""
+
+    @property
+    def is_date_filtered(self) -> bool:
+        return self.start_date is not None or self.end_date is not None
+
+    @property
+    def is_user_filtered(self) -> bool:
+        return self.is_date_filtered or bool(self.countries or self.kyc_statuses)
+
+    @property
+    def is_transaction_filtered(self) -> bool:
+        return self.is_date_filtered or bool(self.corridors or self.narration)
+
+
+def corridor_label(send_currency, receive_currency) -> str:
+    """Formats a currency corridor, e.g. 'CAD → NGN'"""
+
+    return send_currency + " → " + receive_currency
+
+
+@st.cache_resource(show_spinner="Indexing users...")
+def load_indexed_users() -> IndexedFrame:
+    """Loads the processed users sorted by DateCreated with segment indexes"""
+
+    users = IndexedFrame(pd.read_csv(PROCESSED_USER_DATA), "DateCreated")
+    users.add_segment("ResidenceCountry", users.frame["ResidenceCountry"])
+    users.add_segment("KycStatus", users.frame["KycStatus"])
+    return users
+
+
+@st.cache_resource(show_spinner="Indexing transactions...")
+def load_indexed_transactions() -> IndexedFrame:
+    """
+    Loads the processed transactions sorted by DateCreated, indexed by corridor
+    and by the sending user's country and KYC status.
+    """
+
+    transactions = IndexedFrame(
+        pd.read_csv(PROCESSED_TRANSACTION_DATA), "DateCreated"
+    )
+    users = load_indexed_users().frame.set_index("Id")
+    users = users[~users.index.duplicated()]
+    user_ids = transactions.frame["UserId"]
+
+    transactions.add_segment(
+        "ResidenceCountry", user_ids.map(users["ResidenceCountry"])
+    )
+    transactions.add_segment("KycStatus", user_ids.map(users["KycStatus"]))
+    transactions.add_segment(
+        "Corridor",
+        corridor_label(
+            transactions.frame["SendCurrencyId"],
+            transactions.frame["ReceiveCurrencyId"],
+        ),
+    )
+    return transactions
+
+
+def filtered_users(filters: Filters) -> pd.DataFrame:
+    """Returns a read-only view of the users matching the filters"""
+
+    return load_indexed_users().view(
+        filters.start_date,
+        filters.end_date,
+        {"ResidenceCountry": filters.countries, "KycStatus": filters.kyc_statuses},
+    )
+
+
+def filtered_transactions(filters: Filters) -> pd.DataFrame:
+    """Returns a read-only view of the transactions matching the filters"""
+
+    rows = None
+    if filters.narration:
+        rows = load_narration_index().search(filters.narration)
+
+    return load_indexed_transactions().view(
+        filters.start_date,
+        filters.end_date,
+        {
+            "ResidenceCountry": filters.countries,
+            "KycStatus": filters.kyc_statuses,
+            "Corridor": filters.corridors,
+        },
+        rows,
+    )
+
+
+def filtered_user_features(filters: Filters) -> pd.DataFrame:
+    """
+    Returns the per-user transaction features for the filtered transactions.
+    Country and KYC filters keep or drop all of a user's transactions, so they
+    select rows of the precomputed table; date, corridor and narration filters
+    need the features rebuilt from the narrowed transactions.
+    """
+
+    if filters.is_transaction_filtered:
+        return build_user_features(filtered_transactions(filters))
+
+    features = load_user_features()
+    if filters.countries or filters.kyc_statuses:
+        features = features[features["UserId"].isin(filtered_users(filters)["Id"])]
+    return features
+
+
+def render_filters() -> Filters:
+    """Renders the global sidebar filters and returns the selected state"""
+
+    users = load_indexed_users()
+    transactions = load_indexed_transactions()
+
+    dates = pd.concat(
+        [
+            users.frame["DateCreated"].iloc[[0, -1]],
+            transactions.frame["DateCreated"].iloc[[0, -1]],
+        ]
+    ).dropna()
+    min_date, max_date = dates.min().date(), dates.max().date()
+
+    st.sidebar.markdown("🔎 **Filters**")
+    date_range = st.sidebar.date_input(
+        "Date Range",
+        value=(min_date, max_date),
+        min_value=min_date,
+        max_value=max_date,
+    )
+    countries = st.sidebar.multiselect(
+        "Residence Country", users.segment_values("ResidenceCountry")
+    )
+    kyc_statuses = st.sidebar.multiselect(
+        "KYC Status",
+        users.segment_values("KycStatus"),
+        format_func=lambda status: KYC_STATUS_LABELS.get(status, str(status)),
+    )
+    corridors = st.sidebar.multiselect(
+        "Corridor",
+        transactions.segment_values("Corridor"),
+        help="Applies to transaction metrics only",
+    )
+    narration = st.sidebar.text_input(
+        "Narration Search",
+        help=(
+            "Applies to transaction metrics only. Matches whole words; end a "
+            "word with * to match a prefix, e.g. educ*"
+        ),
+    )
+
+    # A half-picked range (only a start date) leaves the end open
+    start_date, end_date = (list(date_range) + [None, None])[:2]
+    return Filters(
+        start_date=None if start_date == min_date else start_date,
+        end_date=None if end_date in (None, max_date) else end_date,
+        countries=tuple(countries),
+        kyc_statuses=tuple(kyc_statuses),
+        corridors=tuple(corridors),
+        narration=narration.strip(),
+    )
@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+
+
+class IndexedFrame:
+    """
+    Keeps a DataFrame sorted by a date column so date ranges are found by
+    binary search, plus per-segment position indexes (value -> sorted row
+    positions) so segment filters never scan the full frame.
+
+    Row ids are the rows' positions in the frame as given, which is how
+    external indexes (e.g. the narration index) refer to them.
+    """
+
+    def __init__(self, frame: pd.DataFrame, date_column: str):
+        frame = frame.reset_index(drop=True)
+        frame[date_column] = pd.to_datetime(frame[date_column])
+
+        # Maps row ids to positions; None while the two are the same
+        self._row_positions = None
+        if not frame[date_column].is_monotonic_increasing:
+            frame = frame.sort_values(date_column, kind="stable")
+            self._row_positions = np.empty(len(frame), dtype=np.intp)
+            self._row_positions[frame.index.to_numpy()] = np.arange(len(frame))
+
+        self.frame = frame.reset_index(drop=True)
+        self.date_column = date_column
+        self.segments = {}
+        self._dates = self.frame[date_column].to_numpy()
+
+    def add_segment(self, name: str, keys) -> None:
+        """Indexes the rows by `keys`, which must be aligned with `self.frame`"""
+
+        keys = pd.Series(np.asarray(keys), index=self.frame.index)
+        self.segments[name] = keys.groupby(keys, observed=True).indices
+
+    def segment_values(self, name: str) -> list:
+        """Returns the distinct values of an indexed segment"""
+
+        return sorted(self.segments[name])
+
+    def date_bounds(self, start=None, end=None) -> tuple:
+        """Returns the [lo, hi) row positions covering the inclusive date range"""
+
+        lo = 0
+        hi = len(self._dates)
+        if start is not None:
+            start = pd.Timestamp(start)
+            lo = np.searchsorted(self._dates, np.datetime64(start), "left")
+        if end is not None:
+            end = pd.Timestamp(end) + pd.Timedelta(days=1)
+            hi = np.searchsorted(self._dates, np.datetime64(end), "left")
+        return int(lo), int(hi)
+
+    def row_positions(self, row_ids) -> np.ndarray:
+        """Converts row ids to sorted positions in `self.frame`"""
+
+        row_ids = np.asarray(row_ids, dtype=np.intp)
+        row_ids = row_ids[row_ids < len(self.frame)]
+        if self._row_positions is None:
+            return row_ids
+        return np.sort(self._row_positions[row_ids])
+
+    def positions(self, start=None, end=None, segments: dict = None, rows=None):
+        """
+        Returns the sorted row positions matching the date range, every
+        segment filter and, if given, the sorted row ids in `rows`; or a
+        (lo, hi) slice when only the date range applies.
+        """
+
+        lo, hi = self.date_bounds(start, end)
+
+        candidates = []
+        for name, values in (segments or {}).items():
+            if not values:
+                continue
+            index = self.segments[name]
+            parts = [index[value] for value in values if value in index]
+            # Segment values are disjoint, so the union is a plain merge
+            candidates.append(
+                np.sort(np.concatenate(parts)) if parts else np.array([], dtype=np.intp)
+            )
+        if rows is not None:
+            candidates.append(self.row_positions(rows))
+
+        result = None
+        for matched in candidates:
+            # Positions are sorted, so clipping to the date range is a binary search
+            matched = matched[
+                np.searchsorted(matched, lo) : np.searchsorted(matched, hi)
+            ]
+            result = (
+                matched
+                if result is None
+                else np.intersect1d(result, matched, assume_unique=True)
+            )
+
+        return (lo, hi) if result is None else result
+
+    def view(
+        self, start=None, end=None, segments: dict = None, rows=None
+    ) -> pd.DataFrame:
+        """Returns the rows matching the filters; treat the result as read-only"""
+
+        positions = self.positions(start, end, segments, rows)
+        if isinstance(positions, tuple):
+            return self.frame.iloc[positions[0] : positions[1]]
+        return self.frame.take(positions)
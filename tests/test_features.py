@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from da_assessment.scripts.features import (
+    build_user_features,
+    read_user_features,
+    update_user_features,
+)
+
+
+def make_transactions(rows: int = 200, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(
+        np.sort(rng.integers(0, 60 * 24, rows)), unit="h"
+    )
+    return pd.DataFrame(
+        {
+            "UserId": rng.choice([f"u{i}" for i in range(40)], rows),
+            "DateCreated": dates.strftime("%Y-%m-%d %H:%M:%S"),
+            "BaseAmount": rng.uniform(1, 500, rows).round(2),
+        }
+    )
+
+
+def by_user(features: pd.DataFrame) -> pd.DataFrame:
+    return features.sort_values("UserId").reset_index(drop=True)
+
+
+def fold(transactions: pd.DataFrame, chunk_size: int) -> pd.DataFrame:
+    features, user_days = None, None
+    for start in range(0, len(transactions), chunk_size):
+        chunk = transactions.iloc[start : start + chunk_size]
+        features, user_days = update_user_features(features, user_days, chunk)
+    return features
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 200])
+def test_folding_chunks_matches_full_build(chunk_size):
+    transactions = make_transactions()
+    features = fold(transactions, chunk_size)
+
+    pd.testing.assert_frame_equal(
+        by_user(features), by_user(build_user_features(transactions))
+    )
+
+
+def test_segments_and_active_days():
+    transactions = pd.DataFrame(
+        {
+            "UserId": ["a"] * 4 + ["b"] * 21,
+            "DateCreated": ["2024-01-01 09:00", "2024-01-01 18:00"]
+            + ["2024-01-02", "2024-01-05"]
+            + ["2024-02-01"] * 21,
+            "BaseAmount": [10.0, 20.0, 30.0, 40.0] + [1.0] * 21,
+        }
+    )
+    features = by_user(build_user_features(transactions))
+
+    assert features["TransactionCount"].tolist() == [4, 21]
+    assert features["ActiveDays"].tolist() == [3, 1]
+    assert features["AvgBaseAmount"].tolist() == [25.0, 1.0]
+    assert features["Segment"].astype(str).tolist() == ["4-5", "20+"]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_folding_shuffled_chunks_matches_full_build(seed):
+    transactions = make_transactions().sample(frac=1, random_state=seed)
+    features = fold(transactions, chunk_size=23)
+
+    pd.testing.assert_frame_equal(
+        by_user(features), by_user(build_user_features(transactions))
+    )
+
+
+def test_saved_features_round_trip(tmp_path):
+    path = tmp_path / "features.csv"
+    features = build_user_features(make_transactions())
+    features.to_csv(path, index=False)
+
+    pd.testing.assert_frame_equal(read_user_features(path), features)
@@ -0,0 +1,98 @@
+import pandas as pd
+import pytest
+
+from da_assessment.scripts.identity import IdentityIndex, normalize_emails
+
+
+def make_users(ids, emails):
+    return pd.DataFrame({"Id": ids, "UserName": emails})
+
+
+def test_normalize_emails_collapses_aliases():
+    emails = pd.Series(["A.B+promo@Mail.com", "ab@mail.com", "no-at-sign"])
+
+    assert list(normalize_emails(emails)) == [
+        "ab@mail.com",
+        "ab@mail.com",
+        "no-at-sign",
+    ]
+
+
+def test_update_tracks_clusters():
+    index = IdentityIndex()
+    added = index.update(
+        make_users(["u1", "u2", "u3"], ["a.b@x.com", "ab+1@x.com", "c@x.com"])
+    )
+
+    assert added == 3
+    assert index.multi_account_count == 1
+    assert index.duplicates_of("u1") == ["u2"]
+    assert index.clusters()["Accounts"].tolist() == [2]
+
+
+def test_update_prunes_users_no_longer_present(tmp_path):
+    path = tmp_path / "index.csv"
+    index = IdentityIndex()
+    index.update(make_users(["u1", "u2", "u3"], ["ab@x.com", "a.b@x.com", "c@x.com"]))
+    index.save(path)
+
+    index = IdentityIndex.load(path)
+    index.update(make_users(["u1", "u3"], ["ab@x.com", "c@x.com"]))
+    index.save(path)
+
+    assert index.multi_account_count == 0
+    assert index.duplicates_of("u1") == []
+    reloaded = IdentityIndex.load(path)
+    assert sorted(reloaded.user_keys) == ["u1", "u3"]
+    assert reloaded.multi_account_count == 0
+
+
+def test_update_rekeys_changed_emails(tmp_path):
+    path = tmp_path / "index.csv"
+    index = IdentityIndex()
+    index.update(
+        make_users(["u1", "u2", "u3"], ["ab@x.com", "a.b@x.com", "c@x.com"])
+    )
+    index.save(path)
+
+    index = IdentityIndex.load(path)
+    added = index.update(
+        make_users(["u1", "u2", "u3"], ["ab@x.com", "c+new@x.com", "c@x.com"])
+    )
+    index.save(path)
+
+    assert added == 1
+    assert index.duplicates_of("u1") == []
+    assert sorted(index.duplicates_of("u2")) == ["u3"]
+    reloaded = IdentityIndex.load(path)
+    assert reloaded.multi_account_count == 1
+    assert reloaded.clusters()["UserIds"].map(sorted).tolist() == [["u2", "u3"]]
+
+
+def test_update_drops_users_whose_email_is_removed():
+    index = IdentityIndex()
+    index.update(make_users(["u1", "u2"], ["ab@x.com", "a.b@x.com"]))
+    added = index.update(make_users(["u1", "u2"], ["ab@x.com", None]))
+
+    assert added == 0
+    assert "u2" not in index.user_keys
+    assert index.multi_account_count == 0
+
+
+def test_save_appends_only_new_users(tmp_path):
+    path = tmp_path / "index.csv"
+    index = IdentityIndex()
+    index.update(make_users(["u1"], ["ab@x.com"]))
+    index.save(path)
+    index.update(make_users(["u1", "u2"], ["ab@x.com", "a.b@x.com"]))
+    index.save(path)
+
+    assert len(pd.read_csv(path)) == 2
+    assert IdentityIndex.load(path).multi_account_count == 1
+
+
+def test_load_missing_file():
+    with pytest.raises(FileNotFoundError):
+        IdentityIndex.load("does-not-exist.csv")
+
+    assert IdentityIndex.load("does-not-exist.csv", missing_ok=True).accounts == {}
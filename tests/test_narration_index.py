@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from da_assessment.scripts.narration_index import NarrationIndex, Segment
+
+NARRATIONS = pd.Series(
+    [
+        "Education services",
+        "Health-related expenses",
+        "education fees",
+        None,
+        "Family support",
+        "Health insurance",
+        "EDUCATION support",
+        "",
+    ]
+)
+
+
+def build_index(chunk_size: int) -> NarrationIndex:
+    index = NarrationIndex()
+    for start in range(0, len(NARRATIONS), chunk_size):
+        index.add(NARRATIONS.iloc[start : start + chunk_size])
+    return index
+
+
+def test_term():
+    index = build_index(3)
+
+    assert list(index.term("education")) == [0, 2, 6]
+    assert list(index.term("Health")) == [1, 5]
+    assert list(index.term("educ")) == []
+
+
+def test_prefix():
+    index = build_index(3)
+
+    assert list(index.prefix("edu")) == [0, 2, 6]
+    assert list(index.prefix("s")) == [0, 4, 6]
+    assert list(index.prefix("zzz")) == []
+
+
+def test_multi_word_search_is_and():
+    index = build_index(3)
+
+    assert list(index.search("education support")) == [6]
+    assert list(index.search("health-rel*")) == [1]
+    assert list(index.search("health ins*")) == [5]
+    assert list(index.search("education health")) == []
+    assert list(index.search("  ")) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5])
+def test_compacted_index_equals_single_segment(chunk_size):
+    single = Segment.build(NARRATIONS, 0)
+    index = build_index(chunk_size)
+    index.compact()
+
+    (compacted,) = index.segments
+    np.testing.assert_array_equal(compacted.vocabulary, single.vocabulary)
+    np.testing.assert_array_equal(compacted.offsets, single.offsets)
+    np.testing.assert_array_equal(compacted.postings, single.postings)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "index.npz"
+    build_index(2).save(path)
+    loaded = NarrationIndex.load(path)
+
+    assert loaded.row_count == len(NARRATIONS)
+    assert list(loaded.search("educ*")) == [0, 2, 6]
+
+
+def test_load_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        NarrationIndex.load(tmp_path / "missing.npz")
+
+    assert NarrationIndex.load(tmp_path / "missing.npz", missing_ok=True).row_count == 0
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+
+from da_assessment.scripts.validation import (
+    USER_FIELD_RULES,
+    USER_RULES,
+    ValidationStage,
+    transaction_rules,
+)
+
+
+def make_users():
+    return pd.DataFrame(
+        {
+            "Id": ["u1", "u2", None, "u4"],
+            "DateCreated": ["2024-01-01", "2024-01-02", "2024-01-03", "not a date"],
+            "DateOfBirth": ["1990-05-01", "#NAME?", "1985-01-01", None],
+        }
+    )
+
+
+def make_transactions():
+    return pd.DataFrame(
+        {
+            "UserId": ["u1", "u2", "u9", None, "u1", "u2"],
+            "DateCreated": ["2024-01-05"] * 6,
+            "SendAmount": [10.0, 5.0, 1.0, 1.0, np.nan, -3.0],
+            "ReceiveAmount": [10.0, 5.0, 1.0, 1.0, 1.0, 1.0],
+            "BaseAmount": [10.0, 5.0, 1.0, 1.0, 1.0, 1.0],
+        }
+    )
+
+
+def test_invalid_date_of_birth_is_nulled_not_quarantined(tmp_path):
+    stage = ValidationStage(USER_RULES, tmp_path / "users.csv", USER_FIELD_RULES)
+    users = stage.run(make_users())
+
+    assert list(users["Id"]) == ["u1", "u2"]
+    assert pd.isna(users.loc[users["Id"] == "u2", "DateOfBirth"]).all()
+    assert stage.counts["invalid_date_of_birth"] == 1
+    assert stage.counts["null_id"] == 1
+    assert stage.counts["invalid_date_created"] == 1
+
+
+def test_user_with_bad_date_of_birth_keeps_transactions(tmp_path):
+    users = ValidationStage(
+        USER_RULES, tmp_path / "users.csv", USER_FIELD_RULES
+    ).run(make_users())
+    stage = ValidationStage(
+        transaction_rules(users["Id"]), tmp_path / "transactions.csv"
+    )
+    transactions = stage.run(make_transactions())
+
+    assert list(transactions["UserId"]) == ["u1", "u2"]
+    assert stage.counts["orphan_user_id"] == 1
+    assert stage.counts["null_user_id"] == 1
+
+
+def test_null_amounts_are_not_counted_as_negative(tmp_path):
+    stage = ValidationStage(transaction_rules(["u1", "u2"]), tmp_path / "q.csv")
+    stage.run(make_transactions())
+
+    assert stage.counts["null_send_amount"] == 1
+    assert stage.counts["negative_send_amount"] == 1
+
+
+def test_quarantine_file_lists_failed_rules_across_chunks(tmp_path):
+    path = tmp_path / "q.csv"
+    stage = ValidationStage(transaction_rules(["u1", "u2"]), path)
+    transactions = make_transactions()
+    valid = pd.concat(stage.run_chunks([transactions.iloc[:3], transactions.iloc[3:]]))
+
+    quarantined = pd.read_csv(path)
+    assert len(valid) + len(quarantined) == len(transactions)
+    assert stage.rows_quarantined == len(quarantined) == 4
+    assert set(quarantined["FailedRules"]) == {
+        "orphan_user_id",
+        "null_user_id",
+        "null_send_amount",
+        "negative_send_amount",
+    }